@@ -22,6 +22,13 @@ Player = Literal["X", "O"]
 Board = List[List[Optional[Player]]]
 Move = Tuple[int, int]
 
+# All eight winning lines as cell coordinates: rows, columns, then diagonals
+WIN_LINES: Tuple[Tuple[Move, Move, Move], ...] = (
+    tuple(tuple((r, c) for c in range(3)) for r in range(3))
+    + tuple(tuple((r, c) for r in range(3)) for c in range(3))
+    + (((0, 0), (1, 1), (2, 2)), ((0, 2), (1, 1), (2, 0)))
+)
+
 
 class TicTacToeEngine:
     """
@@ -34,6 +41,7 @@ class TicTacToeEngine:
         self.current_player: Player = "X"
         self.winner: Optional[Player] = None
         self.tie: bool = False
+        self.winning_line: List[Move] = []
 
     def reset(self) -> None:
         """
@@ -43,6 +51,7 @@ class TicTacToeEngine:
         self.current_player = "X"
         self.winner = None
         self.tie = False
+        self.winning_line = []
 
     def get_board(self) -> Board:
         """
@@ -167,25 +176,19 @@ class TicTacToeEngine:
         """
         Check the board for a winner.
 
+        The first complete line found is stored in `winning_line` so callers
+        (e.g. the GUI highlight) don't have to scan the board again.
+
         Returns:
             'X', 'O', or None if there is no winner.
         """
-        lines = []
-
-        # Rows
-        lines.extend(self.board)
-
-        # Columns
-        for c in range(3):
-            lines.append([self.board[r][c] for r in range(3)])
-
-        # Diagonals
-        lines.append([self.board[i][i] for i in range(3)])
-        lines.append([self.board[i][2 - i] for i in range(3)])
-
-        for line in lines:
-            if line[0] is not None and line[0] == line[1] == line[2]:
-                return line[0]
+        b = self.board
+        for line in WIN_LINES:
+            (r0, c0), (r1, c1), (r2, c2) = line
+            v = b[r0][c0]
+            if v is not None and v == b[r1][c1] == b[r2][c2]:
+                self.winning_line = list(line)
+                return v
 
         return None
 
@@ -424,6 +427,7 @@ def _run_tests() -> None:
     game.play_move(1, 1)
     game.play_move(0, 2)
     _expect(game.get_winner() == "X", "Row win detected for X", results)
+    _expect(game.winning_line == [(0, 0), (0, 1), (0, 2)], "Winning line recorded", results)
     _expect(game.is_terminal(), "Game is terminal after win", results)
     _expect(game.get_legal_moves() == [], "No legal moves after terminal state", results)
     post_win_move = game.play_move(2, 2)
@@ -459,6 +463,7 @@ def _run_tests() -> None:
     game.reset()
     _expect(not game.is_terminal(), "Game not terminal after reset", results)
     _expect(game.get_winner() is None, "No winner after reset", results)
+    _expect(game.winning_line == [], "Winning line cleared after reset", results)
     _expect(not game.is_tie(), "Not a tie after reset", results)
     _expect(game.get_current_player() == "X", "X to move after reset", results)
 
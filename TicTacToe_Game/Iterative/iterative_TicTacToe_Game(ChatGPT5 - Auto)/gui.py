@@ -26,6 +26,13 @@ class TicTacToeGUI:
         self.ai_busy: bool = False  # block clicks while AI is "thinking"
         self.winning_cells: List[Tuple[int, int]] = []
 
+        # Pending after() ids, cancelled on New/mode change. Bumping _gen also
+        # makes any callback that slipped through see it belongs to an old game.
+        self._ai_job: Optional[str] = None
+        self._blink_job: Optional[str] = None
+        self._blink_prev: str = ""
+        self._gen: int = 0
+
         # Menu bar
         self._build_menubar()
 
@@ -133,6 +140,11 @@ class TicTacToeGUI:
     def refresh(self) -> None:
         board: Board = self.game.get_board()
 
+        # Ask the engine once per refresh; the helpers below reuse these answers
+        cur = self.game.get_current_player()
+        terminal = self.game.is_terminal()
+        winner = self.game.get_winner()
+
         # Update button text and color
         for r in range(3):
             for c in range(3):
@@ -147,31 +159,29 @@ class TicTacToeGUI:
                     btn.configure(bg="#c7f7c4")  # gentle green highlight
 
         # Status text
-        winner = self.game.get_winner()
         if winner is not None:
             self.status_var.set(f"{winner} wins!")
-        elif self.game.is_tie():
+        elif terminal:
             self.status_var.set("Tie game.")
+        elif self._is_human_turn_cached(cur):
+            self.status_var.set(f"{cur} to move")
         else:
-            turn = self.game.get_current_player()
-            if self._is_human_turn():
-                self.status_var.set(f"{turn} to move")
-            else:
-                self.status_var.set(f"{turn} to move (AI{' thinking...' if self.ai_busy else ''})")
+            self.status_var.set(f"{cur} to move (AI{' thinking...' if self.ai_busy else ''})")
 
         # Enable/disable interactability
-        self._update_interactivity()
+        self._update_interactivity(cur, terminal, board)
 
-    def _update_interactivity(self) -> None:
+    def _update_interactivity(self, cur: str, terminal: bool, board: Board) -> None:
         # In non-human modes (AIvAI) or AI turns, disable clicking
-        allow_clicks = (not self.game.is_terminal()) and self._is_human_turn() and (not self.ai_busy)
+        allow_clicks = (not terminal) and self._is_human_turn_cached(cur) and (not self.ai_busy)
         for r in range(3):
+            row = board[r]
             for c in range(3):
-                cell = self.game.get_board()[r][c]
-                enabled = allow_clicks and (cell is None)
+                enabled = allow_clicks and (row[c] is None)
                 self.buttons[r][c]["state"] = tk.NORMAL if enabled else tk.DISABLED
 
     def new_game(self) -> None:
+        self._cancel_pending()
         self.game.reset()
         self.ai_busy = False
         self.winning_cells = []
@@ -187,14 +197,37 @@ class TicTacToeGUI:
         self.new_game()  # start fresh in the new mode
 
     def blink_status(self, msg: str, error: bool = False) -> None:
-        prev = self.status_var.get()
+        # A blink during a blink restarts the timer but keeps the original text
+        if self._blink_job is None:
+            self._blink_prev = self.status_var.get()
+        else:
+            self.root.after_cancel(self._blink_job)
         self.status_var.set(msg)
         self.status_label.config(fg=("red" if error else "black"))
-        self.root.after(900, lambda: (self.status_var.set(prev), self.status_label.config(fg="black")))
+        self._blink_job = self.root.after(900, self._end_blink)
+
+    def _end_blink(self) -> None:
+        self._blink_job = None
+        self.status_var.set(self._blink_prev)
+        self.status_label.config(fg="black")
+
+    def _cancel_pending(self) -> None:
+        """Drop scheduled AI moves and status blinks left over from the current game."""
+        self._gen += 1
+        if self._ai_job is not None:
+            self.root.after_cancel(self._ai_job)
+            self._ai_job = None
+        if self._blink_job is not None:
+            self.root.after_cancel(self._blink_job)
+            self._blink_job = None
+            self.status_label.config(fg="black")
 
     # --------------------- AI plumbing ---------------------
 
     def _is_human_turn(self) -> bool:
+        return self._is_human_turn_cached(self.game.get_current_player())
+
+    def _is_human_turn_cached(self, cur: str) -> bool:
         """
         HvH: always human turn.
         HvAI_X: human is X; human turn iff current == 'X'.
@@ -204,44 +237,47 @@ class TicTacToeGUI:
         if self.mode == "HvH":
             return True
         if self.mode == "HvAI_X":
-            return self.game.get_current_player() == "X"
+            return cur == "X"
         if self.mode == "HvAI_O":
-            return self.game.get_current_player() == "O"
+            return cur == "O"
         return False  # AIvAI
 
-    def _ai_turn(self) -> bool:
+    def _ai_turn_cached(self, cur: str, terminal: bool) -> bool:
         if self.mode == "HvAI_X":
-            return self.game.get_current_player() == "O"
+            return cur == "O"
         if self.mode == "HvAI_O":
-            return self.game.get_current_player() == "X"
+            return cur == "X"
         if self.mode == "AIvAI":
-            return not self.game.is_terminal()
+            return not terminal
         return False
 
     def _maybe_trigger_ai(self) -> None:
         """Schedule AI move when appropriate; never blocks. Adds a small delay for watchability."""
-        if self.game.is_terminal():
+        terminal = self.game.is_terminal()
+        if terminal:
             return
-        if not self._ai_turn():
+        if not self._ai_turn_cached(self.game.get_current_player(), terminal):
             return
 
         # Mark busy, update UI, then schedule compute with a small delay
         self.ai_busy = True
         self.refresh()
-        self.root.after(self.AI_DELAY_MS, self._ai_move_once)
+        self._ai_job = self.root.after(self.AI_DELAY_MS, self._ai_move_once, self._gen)
+
+    def _ai_move_once(self, gen: int) -> None:
+        self._ai_job = None
+        if gen != self._gen:
+            return  # scheduled for a game that has since been replaced
+
+        current = self.game.get_current_player()
+        terminal = self.game.is_terminal()
 
-    def _ai_move_once(self) -> None:
         # If something changed while waiting, bail cleanly
-        if self.game.is_terminal():
-            self.ai_busy = False
-            self.refresh()
-            return
-        if not self._ai_turn():
+        if terminal or not self._ai_turn_cached(current, terminal):
             self.ai_busy = False
             self.refresh()
             return
 
-        current = self.game.get_current_player()
         board_copy = self.game.get_board()
 
         try:
@@ -262,8 +298,7 @@ class TicTacToeGUI:
         else:
             self.refresh()
             # Chain next AI move with the same gentle delay
-            if self._ai_turn():
-                self._maybe_trigger_ai()
+            self._maybe_trigger_ai()
 
     # --------------------- Round/score + polish ---------------------
 
@@ -278,8 +313,7 @@ class TicTacToeGUI:
         else:
             self.scores["T"] += 1
         self._update_score_label()
-        self.refresh()  # apply highlight + final status
-        self._update_interactivity()
+        self.refresh()  # apply highlight + final status (also locks the board)
 
     def _update_score_label(self) -> None:
         self.score_var.set(f"Score — X: {self.scores['X']}   O: {self.scores['O']}   Ties: {self.scores['T']}")
@@ -287,30 +321,9 @@ class TicTacToeGUI:
     def _find_winning_line(self) -> List[Tuple[int, int]]:
         """
         Return list of (r,c) cells forming the winning line, or [] if none.
+        The engine records the line when it detects the win.
         """
-        w = self.game.get_winner()
-        if w is None:
-            return []
-
-        b = self.game.get_board()
-
-        # Rows
-        for r in range(3):
-            if b[r][0] == b[r][1] == b[r][2] == w:
-                return [(r, 0), (r, 1), (r, 2)]
-
-        # Columns
-        for c in range(3):
-            if b[0][c] == b[1][c] == b[2][c] == w:
-                return [(0, c), (1, c), (2, c)]
-
-        # Diagonals
-        if b[0][0] == b[1][1] == b[2][2] == w:
-            return [(0, 0), (1, 1), (2, 2)]
-        if b[0][2] == b[1][1] == b[2][0] == w:
-            return [(0, 2), (1, 1), (2, 0)]
-
-        return []
+        return list(self.game.winning_line)
 
 
 def main() -> None:
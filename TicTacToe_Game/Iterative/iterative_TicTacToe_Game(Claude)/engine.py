@@ -12,7 +12,7 @@ This module provides:
     - Comprehensive unit tests
 
 Usage:
-    from engine import TicTacToe, best_move
+    from engine import TicTacToe, best_move, best_move_inplace, best_line
     
     # Create game
     game = TicTacToe()
@@ -22,7 +22,7 @@ Usage:
     game.make_move(1, 1)  # O plays
     
     # Get AI move
-    ai_move = best_move(game.get_board(), game.current_player)
+    ai_move = best_move_inplace(game)
     game.make_move(ai_move[0], ai_move[1])
 
 Testing:
@@ -32,20 +32,158 @@ Testing:
 ================================================================================
 """
 
-from typing import List, Optional, Tuple
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    from numba import njit  # optional: compiles the search kernel below
+except ImportError:
+    njit = None
+
+try:
+    # optional: C build of minimax, see engine_core.pyx
+    from engine_core import minimax as _compiled_minimax
+except ImportError:
+    _compiled_minimax = None
+
+
+# Cell codes used in TicTacToe.board. get_board() and the board-taking
+# functions below use 'X' / 'O' / None; _to_str() converts between them.
+EMPTY, X, O = 0, 1, 2
+_CELL_STR = (None, 'X', 'O')
+
+
+def _to_str(code: int) -> Optional[str]:
+    """Convert a cell code to 'X', 'O', or None for an empty cell."""
+    return _CELL_STR[code]
+
+
+# Bitboards: bit (row * 3 + col) is set when that player owns cell (row, col)
+FULL_BOARD = 0x1FF
+WIN_MASKS = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o124, 0o421)
+
+
+# WIN_TABLE[bb] is 1 if bitboard bb holds a line: a line is a mask whose
+# popcount survives the AND intact. Win tests become one branch-free index.
+WIN_TABLE = bytes(
+    any(bin(bb & m).count('1') == 3 for m in WIN_MASKS) for bb in range(FULL_BOARD + 1)
+)
+
+
+# STONES[bb] is the number of marks on a bitboard (its popcount)
+STONES = bytes(bin(bb).count('1') for bb in range(FULL_BOARD + 1))
+
+
+def is_win(bb: int) -> bool:
+    """
+    Check whether a bitboard contains three in a row.
+    
+    Args:
+        bb: 9-bit bitboard of one player's marks
+    
+    Returns:
+        True if any of the 8 winning lines is fully occupied
+    """
+    return WIN_TABLE[bb] == 1
+
+
+# LINES_THROUGH[sq]: the WIN_MASKS containing square sq (2 to 4 of them).
+# Only these lines can be completed by a mark placed on sq.
+LINES_THROUGH = tuple(tuple(m for m in WIN_MASKS if m >> sq & 1) for sq in range(9))
+
+
+# LINE_CELLS[m]: the (row, col) cells of winning line m, top-left first
+LINE_CELLS = {m: tuple(divmod(sq, 3) for sq in range(9) if m >> sq & 1) for m in WIN_MASKS}
+
+
+# The board's 8 symmetries (4 rotations, each optionally mirrored), as
+# square maps: SYMMETRIES[t][sq] is where transform t sends square sq.
+# PERMS[t][bb] applies transform t to a whole bitboard in one lookup.
+_ROT90 = (6, 3, 0, 7, 4, 1, 8, 5, 2)   # (r, c) -> (2 - c, r)
+_MIRROR = (2, 1, 0, 5, 4, 3, 8, 7, 6)  # (r, c) -> (r, 2 - c)
+
+
+def _symmetries() -> List[Tuple[int, ...]]:
+    """Build the 8 square maps: each rotation, plain and mirrored."""
+    maps = []
+    sq_map = tuple(range(9))
+    for _ in range(4):
+        maps.append(sq_map)
+        maps.append(tuple(_MIRROR[s] for s in sq_map))
+        sq_map = tuple(_ROT90[s] for s in sq_map)
+    return maps
+
+
+SYMMETRIES = tuple(_symmetries())
+PERMS = tuple(
+    array('H', (sum(1 << m[sq] for sq in range(9) if bb >> sq & 1) for bb in range(FULL_BOARD + 1)))
+    for m in SYMMETRIES
+)
+
+
+def canonical(ai_bb: int, opp_bb: int) -> int:
+    """
+    Key a position by its smallest image under the 8 board symmetries.
+    
+    Args:
+        ai_bb: Bitboard of the AI player's marks
+        opp_bb: Bitboard of the opponent's marks
+    
+    Returns:
+        (ai_bb << 9) | opp_bb, minimised over all symmetric positions
+    """
+    key = ai_bb << 9 | opp_bb
+    for perm in PERMS:
+        k = perm[ai_bb] << 9 | perm[opp_bb]
+        if k < key:
+            key = k
+    return key
+
+
+# Search order inside minimax: center, corners, then edges. Strong moves first
+# means earlier alpha-beta cutoffs; the root keeps row-major order so the
+# tie-break between equal moves is unchanged.
+ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+ORDER_BITS = tuple((sq, 1 << sq) for sq in ORDER)
+
+
+def _encode(board: List[List[Optional[str]]]) -> Tuple[int, int]:
+    """Convert a 3x3 board into (x_bb, o_bb) bitboards."""
+    x_bb = o_bb = 0
+    bit = 1
+    for row in board:
+        for cell in row:
+            if cell == 'X':
+                x_bb |= bit
+            elif cell == 'O':
+                o_bb |= bit
+            bit <<= 1
+    return x_bb, o_bb
 
 
 class TicTacToe:
     """
     Tic-Tac-Toe game engine.
     Handles game state, move validation, and win detection.
+    
+    The board is kept as a list of lists of cell codes (EMPTY, X, O) for
+    display, mirrored by one bitboard per player (x_bb, o_bb) used for
+    win/tie detection. get_board() returns it as 'X' / 'O' / None.
+    
+    board is the live game state: callers may read it directly (or walk it
+    with iter_cells()) to avoid a copy, but must only change it through
+    make_move() and reset().
     """
     
     def __init__(self):
         """Initialize a new game with an empty 3x3 board."""
-        self.board: List[List[Optional[str]]] = [[None for _ in range(3)] for _ in range(3)]
+        self.board: List[List[int]] = [[EMPTY] * 3 for _ in range(3)]
+        self.x_bb: int = 0
+        self.o_bb: int = 0
         self.current_player: str = 'X'  # X always goes first
+        self.last_move: Optional[Tuple[int, int]] = None
         self.winner: Optional[str] = None
+        self.winning_line: Optional[Tuple[Tuple[int, int], ...]] = None
         self.is_game_over: bool = False
     
     def make_move(self, row: int, col: int) -> bool:
@@ -62,7 +200,13 @@ class TicTacToe:
         if not self.is_valid_move(row, col):
             return False
         
-        self.board[row][col] = self.current_player
+        self.last_move = (row, col)
+        if self.current_player == 'X':
+            self.board[row][col] = X
+            self.x_bb |= 1 << (row * 3 + col)
+        else:
+            self.board[row][col] = O
+            self.o_bb |= 1 << (row * 3 + col)
         
         # Check for win or tie
         if self._check_win():
@@ -93,34 +237,25 @@ class TicTacToe:
         if row < 0 or row > 2 or col < 0 or col > 2:
             return False
         
-        return self.board[row][col] is None
+        return self.board[row][col] == EMPTY
     
     def _check_win(self) -> bool:
         """
-        Check if the current player has won.
+        Check if the current player has won with their last move.
+        
+        Only the lines through last_move can have changed, so at most
+        four lines are checked. The completed line's cells are kept in
+        winning_line, so callers never have to search for it again.
         
         Returns:
             True if current player has won, False otherwise
         """
-        player = self.current_player
-        
-        # Check rows
-        for row in self.board:
-            if all(cell == player for cell in row):
+        row, col = self.last_move
+        bb = self.x_bb if self.current_player == 'X' else self.o_bb
+        for m in LINES_THROUGH[row * 3 + col]:
+            if bb & m == m:
+                self.winning_line = LINE_CELLS[m]
                 return True
-        
-        # Check columns
-        for col in range(3):
-            if all(self.board[row][col] == player for row in range(3)):
-                return True
-        
-        # Check diagonals
-        if all(self.board[i][i] == player for i in range(3)):
-            return True
-        
-        if all(self.board[i][2-i] == player for i in range(3)):
-            return True
-        
         return False
     
     def _check_tie(self) -> bool:
@@ -130,17 +265,28 @@ class TicTacToe:
         Returns:
             True if game is tied, False otherwise
         """
-        return all(self.board[row][col] is not None 
-                   for row in range(3) for col in range(3))
+        return (self.x_bb | self.o_bb) == FULL_BOARD
     
     def get_board(self) -> List[List[Optional[str]]]:
         """
         Get the current board state.
         
         Returns:
-            Copy of the current board
+            Copy of the current board, with 'X', 'O', or None in each cell
         """
-        return [row[:] for row in self.board]
+        return [[_CELL_STR[code] for code in row] for row in self.board]
+    
+    def iter_cells(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Walk the live board without copying it.
+        
+        Yields:
+            (row, col, code) for all 9 cells in row-major order, where code
+            is EMPTY, X or O
+        """
+        for row, cells in enumerate(self.board):
+            for col, code in enumerate(cells):
+                yield row, col, code
     
     def get_winner(self) -> Optional[str]:
         """
@@ -153,9 +299,13 @@ class TicTacToe:
     
     def reset(self) -> None:
         """Reset the game to initial state."""
-        self.board = [[None for _ in range(3)] for _ in range(3)]
+        self.board = [[EMPTY] * 3 for _ in range(3)]
+        self.x_bb = 0
+        self.o_bb = 0
         self.current_player = 'X'
+        self.last_move = None
         self.winner = None
+        self.winning_line = None
         self.is_game_over = False
 
 
@@ -168,7 +318,7 @@ def run_tests():
     # Test 1: Import and Initialization
     print("\n[TEST 1] Import and Initialization")
     game = TicTacToe()
-    print(f"Board initialized: {game.board}")
+    print(f"Board initialized: {game.get_board()}")
     print(f"Current player: {game.current_player}")
     print(f"✓ PASS" if game.current_player == 'X' else "✗ FAIL")
     
@@ -181,9 +331,9 @@ def run_tests():
     print("\n[TEST 3] Valid Move Test")
     result = game.make_move(0, 0)
     print(f"Move result: {result}")
-    print(f"Board[0][0]: {game.board[0][0]}")
+    print(f"Board[0][0]: {_to_str(game.board[0][0])}")
     print(f"Current player after move: {game.current_player}")
-    print(f"✓ PASS" if result and game.board[0][0] == 'X' and game.current_player == 'O' else "✗ FAIL")
+    print(f"✓ PASS" if result and game.board[0][0] == X and game.current_player == 'O' else "✗ FAIL")
     
     # Test 4: Invalid Move Test (same spot)
     print("\n[TEST 4] Invalid Move Test (same spot)")
@@ -207,9 +357,15 @@ def run_tests():
     game.make_move(0, 2)  # X (wins)
     print(f"Winner: {game.winner}")
     print(f"Game over: {game.is_game_over}")
-    print(f"Board:\n{game.board[0]}\n{game.board[1]}\n{game.board[2]}")
+    board = game.get_board()
+    print(f"Board:\n{board[0]}\n{board[1]}\n{board[2]}")
     print(f"✓ PASS" if game.winner == 'X' and game.is_game_over else "✗ FAIL")
     
+    # Test 6b: Winning Line Recorded
+    print("\n[TEST 6b] Winning Line Recorded")
+    print(f"Winning line: {game.winning_line}")
+    print(f"✓ PASS" if game.winning_line == ((0, 0), (0, 1), (0, 2)) else "✗ FAIL")
+    
     # Test 7: Win Detection (Vertical)
     print("\n[TEST 7] Win Detection (Vertical)")
     game.reset()
@@ -220,7 +376,8 @@ def run_tests():
     game.make_move(2, 0)  # X (wins)
     print(f"Winner: {game.winner}")
     print(f"Game over: {game.is_game_over}")
-    print(f"Board:\n{game.board[0]}\n{game.board[1]}\n{game.board[2]}")
+    board = game.get_board()
+    print(f"Board:\n{board[0]}\n{board[1]}\n{board[2]}")
     print(f"✓ PASS" if game.winner == 'X' and game.is_game_over else "✗ FAIL")
     
     # Test 8: Win Detection (Diagonal top-left to bottom-right)
@@ -233,7 +390,8 @@ def run_tests():
     game.make_move(2, 2)  # X (wins diagonal)
     print(f"Winner: {game.winner}")
     print(f"Game over: {game.is_game_over}")
-    print(f"Board:\n{game.board[0]}\n{game.board[1]}\n{game.board[2]}")
+    board = game.get_board()
+    print(f"Board:\n{board[0]}\n{board[1]}\n{board[2]}")
     print(f"✓ PASS" if game.winner == 'X' and game.is_game_over else "✗ FAIL")
     
     # Test 9: Win Detection (Diagonal top-right to bottom-left)
@@ -246,7 +404,8 @@ def run_tests():
     game.make_move(2, 0)  # X (wins diagonal)
     print(f"Winner: {game.winner}")
     print(f"Game over: {game.is_game_over}")
-    print(f"Board:\n{game.board[0]}\n{game.board[1]}\n{game.board[2]}")
+    board = game.get_board()
+    print(f"Board:\n{board[0]}\n{board[1]}\n{board[2]}")
     print(f"✓ PASS" if game.winner == 'X' and game.is_game_over else "✗ FAIL")
     
     # Test 10: Tie Detection
@@ -258,7 +417,8 @@ def run_tests():
         game.make_move(row, col)
     print(f"Winner: {game.winner}")
     print(f"Game over: {game.is_game_over}")
-    print(f"Board:\n{game.board[0]}\n{game.board[1]}\n{game.board[2]}")
+    board = game.get_board()
+    print(f"Board:\n{board[0]}\n{board[1]}\n{board[2]}")
     print(f"✓ PASS" if game.winner is None and game.is_game_over else "✗ FAIL")
     
     # Test 11: Can't Move After Game Over
@@ -273,9 +433,25 @@ def run_tests():
     print(f"Current player after reset: {game.current_player}")
     print(f"Game over after reset: {game.is_game_over}")
     print(f"Winner after reset: {game.winner}")
-    empty_board = all(game.board[r][c] is None for r in range(3) for c in range(3))
+    print(f"Winning line after reset: {game.winning_line}")
+    empty_board = game.board == [[EMPTY] * 3 for _ in range(3)]
     print(f"Board is empty: {empty_board}")
-    print(f"✓ PASS" if game.current_player == 'X' and not game.is_game_over and empty_board else "✗ FAIL")
+    print(f"✓ PASS" if game.current_player == 'X' and not game.is_game_over and empty_board and game.winning_line is None else "✗ FAIL")
+    
+    # Test 13: Bitboards Mirror the Board
+    print("\n[TEST 13] Bitboards Mirror the Board")
+    game.reset()
+    game.make_move(0, 0)  # X
+    game.make_move(1, 1)  # O
+    game.make_move(2, 2)  # X
+    print(f"x_bb: {game.x_bb:09b}, o_bb: {game.o_bb:09b}")
+    print(f"✓ PASS" if (game.x_bb, game.o_bb) == _encode(game.get_board()) == (0b100000001, 0b000010000) else "✗ FAIL")
+    
+    # Test 14: iter_cells Walks the Live Board
+    print("\n[TEST 14] iter_cells Walks the Live Board")
+    cells = list(game.iter_cells())
+    print(f"Cells: {cells}")
+    print(f"✓ PASS" if len(cells) == 9 and cells[0] == (0, 0, X) and cells[4] == (1, 1, O) and cells[5] == (1, 2, EMPTY) else "✗ FAIL")
     
     print("\n" + "=" * 50)
     print("TESTS COMPLETE")
@@ -292,7 +468,36 @@ def is_terminal(board: List[List[Optional[str]]]) -> bool:
     Returns:
         True if game is over, False otherwise
     """
-    return winner(board) is not None or len(legal_moves(board)) == 0
+    return evaluate(board, 'X') is not None
+
+
+def evaluate(board: List[List[Optional[str]]], player: str) -> Optional[int]:
+    """
+    Score a finished game in a single pass over the board.
+    
+    Args:
+        board: Current board state
+        player: Player whose point of view is scored ('X' or 'O')
+    
+    Returns:
+        +1 if player has won, -1 if player has lost, 0 for a tie,
+        or None if the game is not over yet
+    """
+    x_bb, o_bb = _encode(board)
+    if player == 'X':
+        return _evaluate_bb(x_bb, o_bb)
+    return _evaluate_bb(o_bb, x_bb)
+
+
+def _evaluate_bb(ai_bb: int, opp_bb: int) -> Optional[int]:
+    """Bitboard form of evaluate(): +1 / -1 / 0, or None while play continues."""
+    if is_win(ai_bb):
+        return 1
+    if is_win(opp_bb):
+        return -1
+    if (ai_bb | opp_bb) == FULL_BOARD:
+        return 0
+    return None
 
 
 def winner(board: List[List[Optional[str]]]) -> Optional[str]:
@@ -305,24 +510,29 @@ def winner(board: List[List[Optional[str]]]) -> Optional[str]:
     Returns:
         'X', 'O', or None if no winner yet
     """
-    # Check rows
-    for row in board:
-        if row[0] == row[1] == row[2] and row[0] is not None:
-            return row[0]
-    
-    # Check columns
-    for col in range(3):
-        if board[0][col] == board[1][col] == board[2][col] and board[0][col] is not None:
-            return board[0][col]
-    
-    # Check diagonals
-    if board[0][0] == board[1][1] == board[2][2] and board[0][0] is not None:
-        return board[0][0]
+    x_bb, o_bb = _encode(board)
+    if is_win(x_bb):
+        return 'X'
+    if is_win(o_bb):
+        return 'O'
+    return None
+
+
+def legal_moves_iter(board: List[List[Optional[str]]]) -> Iterator[Tuple[int, int]]:
+    """
+    Yield legal moves in top-left to bottom-right order without building a list.
     
-    if board[0][2] == board[1][1] == board[2][0] and board[0][2] is not None:
-        return board[0][2]
+    Args:
+        board: Current board state
     
-    return None
+    Yields:
+        (row, col) tuples of empty positions
+    """
+    for r in range(3):
+        row = board[r]
+        for c in range(3):
+            if row[c] is None:
+                yield r, c
 
 
 def legal_moves(board: List[List[Optional[str]]]) -> List[Tuple[int, int]]:
@@ -335,111 +545,415 @@ def legal_moves(board: List[List[Optional[str]]]) -> List[Tuple[int, int]]:
     Returns:
         List of (row, col) tuples representing empty positions
     """
-    moves = []
-    for row in range(3):
-        for col in range(3):
-            if board[row][col] is None:
-                moves.append((row, col))
-    return moves
+    return list(legal_moves_iter(board))
+
+
+# Transposition table: a flat int8 array (512 KB) indexed directly by
+# (is_maximizing << 18) | canonical(ai_bb, opp_bb), holding the exact
+# minimax score or TT_EMPTY. A lookup is a single index, with no hashing,
+# and the 8 symmetric versions of a position share one entry.
+# Keys are relative to the AI player, so entries stay valid whichever side
+# the AI plays and the table never needs clearing.
+TT_EMPTY = 127
+TT = array('b', [TT_EMPTY]) * (1 << 19)
+
+# Search scores favour quick wins and slow losses: a win completed with
+# n marks on the board scores WIN_SCORE - n (a loss the negative), a tie 0.
+# The score depends only on the position, so TT entries stay valid.
+# Scores stay strictly inside +/-WIN_SCORE, which doubles as the infinities
+# of the alpha-beta window and keeps the whole search in plain ints.
+WIN_SCORE = 10
+MIN_SCORE = -WIN_SCORE
+MAX_SCORE = WIN_SCORE
 
 
-def minimax(board: List[List[Optional[str]]], player: str, is_maximizing: bool, 
-            alpha: float, beta: float) -> int:
+def minimax(ai_bb: int, opp_bb: int, is_maximizing: bool,
+            alpha: int, beta: int) -> int:
     """
-    Minimax algorithm with alpha-beta pruning.
+    Minimax algorithm with alpha-beta pruning over bitboards.
+    
+    Neither side may have won already: wins are detected by the caller
+    right after each move, with a WIN_TABLE lookup on the mover's bitboard.
     
     Args:
-        board: Current board state
-        player: The AI player ('X' or 'O')
+        ai_bb: Bitboard of the AI player's marks
+        opp_bb: Bitboard of the opponent's marks
         is_maximizing: True if maximizing player's turn, False if minimizing
         alpha: Alpha value for pruning (best value for maximizer)
         beta: Beta value for pruning (best value for minimizer)
     
     Returns:
-        Score: +1 for AI win, -1 for AI loss, 0 for tie
-    """
-    # Base case: check if terminal state
-    if is_terminal(board):
-        win = winner(board)
-        if win == player:
-            return 1  # AI wins
-        elif win is None:
-            return 0  # Tie
-        else:
-            return -1  # AI loses
+        Score: WIN_SCORE - marks on the board at the end of the game for an
+        AI win, its negative for an AI loss, 0 for a tie
+    """
+    # Module constants bound to locals: the loop below reads them per child,
+    # and a local load is cheaper than a global dict lookup
+    tt, win_table, order_bits, search = TT, WIN_TABLE, ORDER_BITS, minimax
+    
+    # Symmetric positions share one entry: key on the canonical form
+    # (canonical(), inlined since this runs at every node)
+    key = ai_bb << 9 | opp_bb
+    for perm in PERMS:
+        k = perm[ai_bb] << 9 | perm[opp_bb]
+        if k < key:
+            key = k
+    key |= is_maximizing << 18
+    cached = tt[key]
+    if cached != TT_EMPTY:
+        return cached
+    
+    # Base case: no winner yet (see above), so a full board is a tie
+    free = FULL_BOARD & ~(ai_bb | opp_bb)
+    if not free:
+        return 0  # Tie
     
+    # The quickest possible result is a win on the very next move, so scores
+    # here lie within [-best, best]. Clamping the window to that range lets
+    # such a win (or loss) cut off its siblings at once: nothing beats it.
+    best = WIN_SCORE - STONES[ai_bb | opp_bb] - 1
+    alpha_orig, beta_orig = alpha, beta
+    if alpha < -best:
+        alpha = -best
+    if beta > best:
+        beta = best
+    
+    # Moves are tried in ORDER (center, corners, edges). Squares stay as
+    # bits here; only the top level decodes one back to (row, col).
+    # Children get the board by value, so there is nothing to undo.
     if is_maximizing:
         # Maximizing player (AI) wants highest score
-        max_eval = float('-inf')
-        for row, col in legal_moves(board):
-            # Make move
-            board[row][col] = player
-            # Recurse to next depth
-            eval_score = minimax(board, player, False, alpha, beta)
-            # Undo move
-            board[row][col] = None
+        max_eval = MIN_SCORE
+        for sq, bit in order_bits:
+            if not free & bit:
+                continue
+            child = ai_bb | bit
+            if win_table[child]:
+                eval_score = best  # AI wins
+            else:
+                # Recurse to next depth
+                eval_score = search(child, opp_bb, False, alpha, beta)
             
-            max_eval = max(max_eval, eval_score)
-            alpha = max(alpha, eval_score)
+            if eval_score > max_eval:
+                max_eval = eval_score
+                if eval_score > alpha:
+                    alpha = eval_score
             
-            # Alpha-beta pruning: if beta <= alpha, remaining branches won't affect result
-            if beta <= alpha:
+            # Alpha-beta pruning: once alpha >= beta, remaining branches won't affect result
+            if alpha >= beta:
                 break
         
-        return max_eval
+        value = max_eval
     else:
         # Minimizing player (opponent) wants lowest score
-        min_eval = float('inf')
-        opponent = 'O' if player == 'X' else 'X'
-        for row, col in legal_moves(board):
-            # Make move
-            board[row][col] = opponent
-            # Recurse to next depth
-            eval_score = minimax(board, player, True, alpha, beta)
-            # Undo move
-            board[row][col] = None
+        min_eval = MAX_SCORE
+        for sq, bit in order_bits:
+            if not free & bit:
+                continue
+            child = opp_bb | bit
+            if win_table[child]:
+                eval_score = -best  # AI loses
+            else:
+                # Recurse to next depth
+                eval_score = search(ai_bb, child, True, alpha, beta)
             
-            min_eval = min(min_eval, eval_score)
-            beta = min(beta, eval_score)
+            if eval_score < min_eval:
+                min_eval = eval_score
+                if eval_score < beta:
+                    beta = eval_score
             
-            # Alpha-beta pruning: if beta <= alpha, remaining branches won't affect result
-            if beta <= alpha:
+            # Alpha-beta pruning: once alpha >= beta, remaining branches won't affect result
+            if alpha >= beta:
                 break
         
-        return min_eval
+        value = min_eval
+    
+    # A pruned search only bounds the score, so cache exact results only:
+    # values inside the original window, or bounds that hit -best/+best
+    # (no result here is quicker than that).
+    if (value > alpha_orig or value == -best) and (value < beta_orig or value == best):
+        tt[key] = value
+    return value
 
 
-def best_move(board: List[List[Optional[str]]], player: str) -> Tuple[int, int]:
+def _optional_njit(func):
     """
-    Find the best move using minimax with alpha-beta pruning.
+    Compile func with numba when it is installed, otherwise return it unchanged.
+
+    No cache=True: numba's on-disk cache of a recursive function such as
+    _minimax_kernel segfaults when a later run loads it back, so the
+    kernels are compiled afresh in each process. Without a signature
+    that happens on the first call, i.e. the first search for a
+    position outside BEST_MOVE_TABLE, never at import.
+    """
+    if njit is None:
+        return func
+    return njit(func)
+
+
+@_optional_njit
+def _is_win_kernel(bb: int) -> bool:
+    """
+    is_win() for the compiled kernel: the 8 mask tests are combined with
+    bitwise | rather than `or`, so the compiler emits straight-line code
+    with no data-dependent branches.
+    """
+    return (((bb & 0o007) == 0o007) | ((bb & 0o070) == 0o070) | ((bb & 0o700) == 0o700) |
+            ((bb & 0o111) == 0o111) | ((bb & 0o222) == 0o222) | ((bb & 0o444) == 0o444) |
+            ((bb & 0o124) == 0o124) | ((bb & 0o421) == 0o421))
+
+
+@_optional_njit
+def _minimax_kernel(ai_bb: int, opp_bb: int, is_maximizing: bool,
+                    alpha: int, beta: int) -> int:
+    """
+    Integer-only minimax used when numba is available.
+    
+    Same contract and scores as minimax(), but without the transposition
+    table or WIN_TABLE and with nothing but ints and module-level int
+    tuples, so numba can compile the whole recursion to native code.
+    """
+    free = FULL_BOARD & ~(ai_bb | opp_bb)
+    if free == 0:
+        return 0  # Tie
+    # Scores lie within [-top, top]; see minimax(). Marks are counted with
+    # a loop rather than STONES, which numba can't index.
+    stones = 0
+    occupied = ai_bb | opp_bb
+    while occupied:
+        occupied &= occupied - 1
+        stones += 1
+    top = WIN_SCORE - stones - 1
+    if alpha < -top:
+        alpha = -top
+    if beta > top:
+        beta = top
+    
+    if is_maximizing:
+        best = MIN_SCORE
+        for sq in ORDER:
+            bit = 1 << sq
+            if free & bit == 0:
+                continue
+            child = ai_bb | bit
+            if _is_win_kernel(child):
+                score = top  # AI wins
+            else:
+                score = _minimax_kernel(child, opp_bb, False, alpha, beta)
+            if score > best:
+                best = score
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+        return best
+    else:
+        best = MAX_SCORE
+        for sq in ORDER:
+            bit = 1 << sq
+            if free & bit == 0:
+                continue
+            child = opp_bb | bit
+            if _is_win_kernel(child):
+                score = -top  # AI loses
+            else:
+                score = _minimax_kernel(ai_bb, child, True, alpha, beta)
+            if score < best:
+                best = score
+            if best < beta:
+                beta = best
+            if alpha >= beta:
+                break
+        return best
+
+
+def _search_best_move(x_bb: int, o_bb: int, player: str,
+                      use_kernel: bool = True) -> Optional[Tuple[int, int]]:
+    """
+    Search for the best move with minimax (no table lookup).
     
     Args:
-        board: Current board state
+        x_bb: Bitboard of X's marks
+        o_bb: Bitboard of O's marks
         player: The player to move ('X' or 'O')
+        use_kernel: Use the numba kernel when it is available. Building
+            BEST_MOVE_TABLE passes False: the kernel has no TT and is
+            compiled on its first call, so thousands of searches are
+            much quicker through minimax() and its shared TT.
     
     Returns:
-        (row, col) tuple of the best move
+        (row, col) tuple of the best move, or None if the game is already over
     """
-    best_score = float('-inf')
+    if _evaluate_bb(x_bb, o_bb) is not None:
+        return None
+    ai_bb, opp_bb = (x_bb, o_bb) if player == 'X' else (o_bb, x_bb)
+    win_table = WIN_TABLE
+    if _compiled_minimax is not None:
+        search = _compiled_minimax
+    elif njit is not None and use_kernel:
+        search = _minimax_kernel
+    else:
+        search = minimax
+    
+    win_now = WIN_SCORE - STONES[x_bb | o_bb] - 1
+    best_score = MIN_SCORE
     best_move_coords = None
     
-    # Iterate through moves in top-left to bottom-right order for deterministic tie-breaking
-    for row, col in legal_moves(board):
-        # Make move
-        board[row][col] = player
+    # Iterate through moves in top-left to bottom-right order for deterministic tie-breaking.
+    # Every root move is scored with the full window, which is also what makes
+    # each result exact and cacheable in TT. Iterative deepening or an
+    # aspiration window here was measured to search more nodes, not fewer:
+    # depth-limited scores can't be cached, and narrowed windows only bound
+    # the sibling scores, so later positions can't reuse them.
+    free = FULL_BOARD & ~(x_bb | o_bb)
+    while free:
+        lsb = free & -free
+        free ^= lsb
+        sq = lsb.bit_length() - 1
         # Evaluate move using minimax
-        score = minimax(board, player, False, float('-inf'), float('inf'))
-        # Undo move
-        board[row][col] = None
+        if win_table[ai_bb | lsb]:
+            score = win_now  # Immediate win: the quickest there is
+        else:
+            score = search(ai_bb | lsb, opp_bb, False, MIN_SCORE, MAX_SCORE)
         
         # Choose move with highest score (prefer earlier position on ties for determinism)
         if score > best_score:
             best_score = score
-            best_move_coords = (row, col)
+            best_move_coords = divmod(sq, 3)
     
     return best_move_coords
 
 
+def _build_best_move_table() -> dict:
+    """
+    Solve every reachable non-terminal position, walking breadth-first
+    from the empty board.
+    
+    Returns:
+        Dict mapping (x_bb, o_bb, player) to the chosen (row, col)
+    """
+    table = {}
+    frontier = [(0, 0)]
+    player = 'X'
+    while frontier:
+        next_frontier = set()
+        for x_bb, o_bb in frontier:
+            if _evaluate_bb(x_bb, o_bb) is not None:
+                continue
+            table[(x_bb, o_bb, player)] = _search_best_move(x_bb, o_bb, player, use_kernel=False)
+            free = FULL_BOARD & ~(x_bb | o_bb)
+            while free:
+                lsb = free & -free
+                free ^= lsb
+                next_frontier.add((x_bb | lsb, o_bb) if player == 'X' else (x_bb, o_bb | lsb))
+        frontier = next_frontier
+        player = 'O' if player == 'X' else 'X'
+    return table
+
+
+# Every reachable position is solved once at import, so in normal play
+# best_move is a single dict lookup: (x_bb, o_bb, player) -> (row, col)
+BEST_MOVE_TABLE = _build_best_move_table()
+
+
+def best_move(board: List[List[Optional[str]]], player: str) -> Tuple[int, int]:
+    """
+    Find the best move using minimax with alpha-beta pruning.
+    
+    Positions reachable in a normal game are answered from BEST_MOVE_TABLE;
+    anything else (e.g. the wrong side to move) falls back to a search whose
+    result is added to the table.
+    
+    Args:
+        board: Current board state
+        player: The player to move ('X' or 'O')
+    
+    Returns:
+        (row, col) tuple of the best move
+    """
+    x_bb, o_bb = _encode(board)
+    return _lookup_best_move(x_bb, o_bb, player)
+
+
+def best_move_inplace(game: TicTacToe) -> Optional[Tuple[int, int]]:
+    """
+    Find the best move for the player to move in a live game.
+    
+    Reads the game's own bitboards, so unlike best_move(game.get_board(), ...)
+    no copy of the board is made. The game is left exactly as found:
+    nothing is played on it, and game.current_player is only read.
+    
+    The game must not be over yet; callers should check game.is_game_over
+    first (on a finished game there is no move and None is returned).
+    
+    Args:
+        game: Game whose current player should move
+    
+    Returns:
+        (row, col) tuple of the best move, or None if the game is over
+    """
+    return _lookup_best_move(game.x_bb, game.o_bb, game.current_player)
+
+
+def best_move_bb(x_bb: int, o_bb: int, player: str) -> Optional[Tuple[int, int]]:
+    """
+    Find the best move for a position given as bitboards.
+    
+    For callers that hold a snapshot rather than the live game, e.g. a
+    worker thread given (game.x_bb, game.o_bb, game.current_player):
+    the ints can't change under the search, and no board is copied.
+    
+    Args:
+        x_bb: Bitboard of X's marks
+        o_bb: Bitboard of O's marks
+        player: The player to move ('X' or 'O')
+    
+    Returns:
+        (row, col) tuple of the best move, or None if the game is over
+    """
+    return _lookup_best_move(x_bb, o_bb, player)
+
+
+def best_line(game: TicTacToe) -> List[Tuple[int, int]]:
+    """
+    List the moves perfect play makes, for both sides, until the game ends.
+    
+    Works on copies of the game's bitboards, so the game is left untouched;
+    replaying the list with make_move() reaches the same end position as
+    calling best_move_inplace() before every move.
+    
+    Args:
+        game: Game to play out from its current position
+    
+    Returns:
+        List of (row, col) moves, empty if the game is already over
+    """
+    x_bb, o_bb, player = game.x_bb, game.o_bb, game.current_player
+    line = []
+    while True:
+        move = _lookup_best_move(x_bb, o_bb, player)
+        if move is None:
+            return line
+        line.append(move)
+        bit = 1 << (move[0] * 3 + move[1])
+        if player == 'X':
+            x_bb |= bit
+            player = 'O'
+        else:
+            o_bb |= bit
+            player = 'X'
+
+
+def _lookup_best_move(x_bb: int, o_bb: int, player: str) -> Optional[Tuple[int, int]]:
+    """Answer from BEST_MOVE_TABLE, searching (and recording) on a miss."""
+    key = (x_bb, o_bb, player)
+    move = BEST_MOVE_TABLE.get(key)
+    if move is None:
+        move = _search_best_move(x_bb, o_bb, player)
+        if move is not None:
+            BEST_MOVE_TABLE[key] = move
+    return move
+
+
 def run_ai_tests():
     """Test the AI with various game scenarios."""
     print("\n" + "=" * 50)
@@ -470,6 +984,18 @@ def run_ai_tests():
     print(f"AI (O) chose: {move}")
     print(f"✓ PASS" if move == (0, 2) else f"✗ FAIL (expected (0, 2))")
     
+    # Test 2b: An immediate win beats a slower forced win earlier in row-major order
+    print("\n[AI TEST 2b] Prefer the Quickest Win")
+    board2b = [
+        [None, None, None],
+        [None, None, 'X'],
+        ['O', 'O', 'X']
+    ]
+    move = best_move(board2b, 'X')
+    print(f"Board:\n{board2b[0]}\n{board2b[1]}\n{board2b[2]}")
+    print(f"AI (X) chose: {move}")
+    print(f"✓ PASS" if move == (0, 2) else f"✗ FAIL (expected (0, 2))")
+    
     # Test 3: AI should block fork
     print("\n[AI TEST 3] Block Fork")
     board3 = [
@@ -503,11 +1029,83 @@ def run_ai_tests():
         move = best_move(game.get_board(), game.current_player)
         game.make_move(move[0], move[1])
         move_count += 1
-    print(f"Final board:\n{game.board[0]}\n{game.board[1]}\n{game.board[2]}")
+    board = game.get_board()
+    print(f"Final board:\n{board[0]}\n{board[1]}\n{board[2]}")
     print(f"Winner: {game.winner}")
     print(f"Game over: {game.is_game_over}")
     print(f"✓ PASS" if game.winner is None and game.is_game_over else f"✗ FAIL (should tie)")
     
+    # Test 5b: Lookup table agrees with a plain reference minimax (full
+    # window, no pruning, TT or symmetry folding), written independently
+    # of _search_best_move, which built the table
+    print("\n[AI TEST 5b] Lookup Table Matches Reference Minimax")
+    ref_values = {}
+    
+    def ref_move_score(me, opp, bit):
+        """Score of `me` playing `bit`, same scale as minimax."""
+        child = me | bit
+        if is_win(child):
+            return WIN_SCORE - STONES[child | opp]
+        return -ref_value(opp, child)
+    
+    def ref_value(me, opp):
+        """Best score for `me`, to move, in an unfinished position."""
+        if (me, opp) not in ref_values:
+            free = [1 << sq for sq in range(9) if not (me | opp) >> sq & 1]
+            ref_values[(me, opp)] = max((ref_move_score(me, opp, bit) for bit in free), default=0)
+        return ref_values[(me, opp)]
+    
+    def ref_best_move(x_bb, o_bb, p):
+        me, opp = (x_bb, o_bb) if p == 'X' else (o_bb, x_bb)
+        scores = [(ref_move_score(me, opp, 1 << sq), sq) for sq in range(9) if not (x_bb | o_bb) >> sq & 1]
+        best = max(score for score, _ in scores)
+        return divmod(next(sq for score, sq in scores if score == best), 3)  # first in row-major order
+    
+    mismatches = [key for key, move in BEST_MOVE_TABLE.items() if ref_best_move(*key) != move]
+    print(f"Table entries: {len(BEST_MOVE_TABLE)}, mismatches: {len(mismatches)}")
+    print(f"✓ PASS" if not mismatches else f"✗ FAIL (table disagrees with reference)")
+    
+    # Test 5c: In-place lookup matches the board-copy API
+    print("\n[AI TEST 5c] best_move_inplace Matches best_move")
+    game = TicTacToe()
+    game.make_move(0, 0)  # X
+    game.make_move(1, 1)  # O
+    game.make_move(2, 2)  # X
+    board_before = game.get_board()
+    move = best_move_inplace(game)
+    print(f"AI (O) chose: {move}")
+    print(f"✓ PASS" if move == best_move(board_before, 'O') and game.get_board() == board_before else "✗ FAIL")
+    
+    # Test 5d: No move is offered once the game is over
+    print("\n[AI TEST 5d] best_move_inplace on a Finished Game")
+    game = TicTacToe()
+    for r, c in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+        game.make_move(r, c)
+    print(f"✓ PASS" if game.is_game_over and best_move_inplace(game) is None else "✗ FAIL")
+    
+    # Test 5e: All 8 symmetric images of a position share one canonical key
+    print("\n[AI TEST 5e] Symmetric Positions Share a Key")
+    x_bb, o_bb = 0o001, 0o002  # X in a corner, O on the edge beside it
+    keys = {canonical(perm[x_bb], perm[o_bb]) for perm in PERMS}
+    images = {(perm[x_bb], perm[o_bb]) for perm in PERMS}
+    print(f"{len(images)} images, {len(keys)} key(s)")
+    print(f"✓ PASS" if len(images) == 8 and len(keys) == 1 else "✗ FAIL")
+    
+    # Test 5f: best_line replays the same game as asking move by move
+    print("\n[AI TEST 5f] best_line Matches Move-by-Move Play")
+    game = TicTacToe()
+    game.make_move(0, 0)  # X
+    board_before = game.get_board()
+    line = best_line(game)
+    unchanged = game.get_board() == board_before and game.current_player == 'O'
+    played = []
+    while not game.is_game_over:
+        move = best_move_inplace(game)
+        played.append(move)
+        game.make_move(move[0], move[1])
+    print(f"Line: {line}")
+    print(f"✓ PASS" if line == played and unchanged else "✗ FAIL")
+    
     # Test 6: AI should never lose
     print("\n[AI TEST 6] AI Should Never Lose (Random vs AI)")
     import random
@@ -0,0 +1,137 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+================================================================================
+TIC-TAC-TOE ENGINE CORE (OPTIONAL CYTHON BUILD)
+================================================================================
+
+Statically typed copy of engine.minimax, compiled to C.
+
+engine.py uses this module when it has been built and falls back to the
+pure Python search otherwise, so building it is never required.
+
+Build (needs Cython and a C compiler):
+    cythonize -i engine_core.pyx
+
+Same bitboards, scores and search order as engine.py: a win completed with
+n marks on the board scores WIN_SCORE - n, a loss the negative, a tie 0.
+The recursion runs without the GIL over C ints, with its own flat int8
+transposition table.
+
+================================================================================
+"""
+
+from libc.string cimport memset
+
+cdef enum:
+    TT_SIZE = 1 << 19
+
+cdef int WIN_SCORE = 10
+cdef int FULL_BOARD = 0x1FF
+cdef signed char TT_EMPTY = 127
+
+# Rows, columns, diagonals (same masks as engine.WIN_MASKS)
+cdef int[8] WIN_MASKS = [7, 56, 448, 73, 146, 292, 84, 273]
+
+# Center, corners, edges (engine.ORDER)
+cdef int[9] ORDER = [4, 0, 2, 6, 8, 1, 3, 5, 7]
+
+# Keyed (is_maximizing << 18) | (ai_bb << 9) | opp_bb, exact scores only
+cdef signed char TT[TT_SIZE]
+memset(TT, TT_EMPTY, TT_SIZE)
+
+
+cdef inline bint _is_win(int bb) noexcept nogil:
+    cdef int i
+    for i in range(8):
+        if (bb & WIN_MASKS[i]) == WIN_MASKS[i]:
+            return True
+    return False
+
+
+cdef inline int _stones(int bb) noexcept nogil:
+    cdef int n = 0
+    while bb:
+        bb &= bb - 1
+        n += 1
+    return n
+
+
+cdef int _search(int ai_bb, int opp_bb, bint is_maximizing,
+                 int alpha, int beta) noexcept nogil:
+    cdef int key = (is_maximizing << 18) | (ai_bb << 9) | opp_bb
+    cdef signed char cached = TT[key]
+    if cached != TT_EMPTY:
+        return cached
+
+    cdef int free = FULL_BOARD & ~(ai_bb | opp_bb)
+    if free == 0:
+        return 0  # Tie
+
+    # Scores here lie within [-best, best]; see engine.minimax
+    cdef int best = WIN_SCORE - _stones(ai_bb | opp_bb) - 1
+    cdef int alpha_orig = alpha, beta_orig = beta
+    if alpha < -best:
+        alpha = -best
+    if beta > best:
+        beta = best
+
+    cdef int i, bit, child, score, value
+    if is_maximizing:
+        value = -WIN_SCORE
+        for i in range(9):
+            bit = 1 << ORDER[i]
+            if not free & bit:
+                continue
+            child = ai_bb | bit
+            if _is_win(child):
+                score = best  # AI wins
+            else:
+                score = _search(child, opp_bb, False, alpha, beta)
+            if score > value:
+                value = score
+                if score > alpha:
+                    alpha = score
+            if alpha >= beta:
+                break
+    else:
+        value = WIN_SCORE
+        for i in range(9):
+            bit = 1 << ORDER[i]
+            if not free & bit:
+                continue
+            child = opp_bb | bit
+            if _is_win(child):
+                score = -best  # AI loses
+            else:
+                score = _search(ai_bb, child, True, alpha, beta)
+            if score < value:
+                value = score
+                if score < beta:
+                    beta = score
+            if alpha >= beta:
+                break
+
+    # Cache exact results only (see engine.minimax)
+    if (value > alpha_orig or value == -best) and (value < beta_orig or value == best):
+        TT[key] = <signed char>value
+    return value
+
+
+def minimax(int ai_bb, int opp_bb, bint is_maximizing, int alpha, int beta):
+    """
+    Drop-in replacement for engine.minimax, same arguments and scores.
+
+    Args:
+        ai_bb: Bitboard of the AI player's marks
+        opp_bb: Bitboard of the opponent's marks
+        is_maximizing: True if maximizing player's turn, False if minimizing
+        alpha: Alpha value for pruning (best value for maximizer)
+        beta: Beta value for pruning (best value for minimizer)
+
+    Returns:
+        Score of the position for the AI player
+    """
+    cdef int value
+    with nogil:
+        value = _search(ai_bb, opp_bb, is_maximizing, alpha, beta)
+    return value
@@ -10,7 +10,8 @@ This module provides:
     - Game mode support: Human vs Human, Human vs AI, AI vs AI
     - Score tracking across multiple games
     - Visual feedback: color-coded marks, winning line highlighting
-    - Responsive UI: non-blocking AI moves using tkinter's after()
+    - Responsive UI: AI searches run on a worker thread, results are
+      applied on the Tk thread with after()
 
 Features:
     ✓ 3x3 clickable button grid
@@ -25,16 +26,35 @@ Usage:
     main()  # Launches the GUI
 
 Integration:
-    Imports TicTacToe and best_move from engine.py
+    Imports TicTacToe, best_move_bb, best_line and the X / O cell codes from engine.py
     All game logic is handled by the engine module
     GUI is purely a display and interaction layer
 
 ================================================================================
 """
 
+import time
 import tkinter as tk
-from tkinter import messagebox
-from engine import TicTacToe, best_move
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from tkinter import font, messagebox
+from engine import TicTacToe, best_move_bb, best_line, EMPTY, X, O
+
+
+# Button options for each cell code (X in blue, O in red). A played cell is
+# only ever drawn over an empty one, whose background is already the default,
+# so it just flips to disabled; the mark color comes from disabledforeground.
+# Only an empty cell resets the background (clearing a winning-line highlight).
+CELL_STYLES = {
+    X: {'text': "X", 'state': tk.DISABLED, 'disabledforeground': "blue"},
+    O: {'text': "O", 'state': tk.DISABLED, 'disabledforeground': "red"},
+    EMPTY: {'text': "", 'state': tk.NORMAL, 'bg': "SystemButtonFace"},
+}
+
+# AI moves are never played closer together than this, however the ticks
+# end up scheduled
+AI_MIN_INTERVAL_MS = 250
 
 
 class TicTacToeGUI:
@@ -46,6 +66,13 @@ class TicTacToeGUI:
         self.root.title("Tic-Tac-Toe")
         self.root.resizable(False, False)
         
+        # Fonts are resolved by Tk once here and shared by every widget
+        self.title_font = font.Font(family="Arial", size=12, weight="bold")
+        self.score_font = font.Font(family="Arial", size=11)
+        self.btn_font = font.Font(family="Arial", size=32, weight="bold")
+        self.status_font = font.Font(family="Arial", size=14)
+        self.reset_font = font.Font(family="Arial", size=12)
+        
         # Initialize game engine
         self.game = TicTacToe()
         
@@ -61,6 +88,35 @@ class TicTacToeGUI:
         # AI processing flag
         self.ai_thinking = False
         
+        # Cell code each button currently shows (None: not drawn yet)
+        self._rendered = [None] * 9
+        
+        # Nesting depth of _batched() blocks
+        self._batch_depth = 0
+        
+        # Moves of the AI vs AI game being played back (None when idle)
+        self.ai_plan = None
+        self._plan_index = 0
+        
+        # Pending after() id of the next AI turn (None when nothing is scheduled)
+        self._ai_job = None
+        
+        # time.monotonic() of the last AI tick that played, in ms
+        self._last_tick_ms = 0.0
+        
+        # AI searches run here, off the Tk thread. Bumping _ai_gen makes the
+        # result of any search still in flight stale, so it is dropped.
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._ai_gen = 0
+        
+        # Bound once for the AI path instead of looked up on every turn
+        self._best_move = best_move_bb
+        self._after = root.after
+        self._after_cancel = root.after_cancel
+        
+        # Closing the window also stops the AI timer and worker thread
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        
         # Create GUI elements
         self.create_menu_bar()
         self.create_scoreboard()
@@ -81,7 +137,7 @@ class TicTacToeGUI:
         game_menu.add_command(label="New", command=self.new_game)
         game_menu.add_command(label="Reset Scores", command=self.reset_scores)
         game_menu.add_separator()
-        game_menu.add_command(label="Quit", command=self.root.quit)
+        game_menu.add_command(label="Quit", command=self.close)
         
         # Mode menu
         mode_menu = tk.Menu(menubar, tearoff=0)
@@ -99,13 +155,13 @@ class TicTacToeGUI:
         tk.Label(
             scoreboard_frame,
             text="SCOREBOARD",
-            font=("Arial", 12, "bold")
+            font=self.title_font
         ).pack()
         
         self.score_label = tk.Label(
             scoreboard_frame,
             text="",
-            font=("Arial", 11),
+            font=self.score_font,
             pady=5
         )
         self.score_label.pack()
@@ -117,6 +173,7 @@ class TicTacToeGUI:
         board_frame = tk.Frame(self.root)
         board_frame.pack(padx=10, pady=10)
         
+        # Each button's command is on_cell_click bound to its cell
         self.buttons = []
         for row in range(3):
             button_row = []
@@ -124,10 +181,10 @@ class TicTacToeGUI:
                 button = tk.Button(
                     board_frame,
                     text="",
-                    font=("Arial", 32, "bold"),
+                    font=self.btn_font,
                     width=5,
                     height=2,
-                    command=lambda r=row, c=col: self.on_cell_click(r, c)
+                    command=partial(self.on_cell_click, row, col)
                 )
                 button.grid(row=row, column=col, padx=2, pady=2)
                 button_row.append(button)
@@ -138,7 +195,7 @@ class TicTacToeGUI:
         self.status_label = tk.Label(
             self.root,
             text="",
-            font=("Arial", 14),
+            font=self.status_font,
             pady=10
         )
         self.status_label.pack()
@@ -148,13 +205,29 @@ class TicTacToeGUI:
         self.reset_button = tk.Button(
             self.root,
             text="New Game",
-            font=("Arial", 12),
+            font=self.reset_font,
             command=self.new_game,
             padx=20,
             pady=5
         )
         self.reset_button.pack(pady=10)
     
+    @contextmanager
+    def _batched(self):
+        """
+        Group a run of widget updates.
+        
+        Tk's pending redraws are flushed once with update_idletasks() when
+        the outermost block ends; nested blocks just join it.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.root.update_idletasks()
+    
     def on_cell_click(self, row, col):
         """Handle cell button click."""
         # Don't allow clicks while AI is thinking
@@ -181,116 +254,147 @@ class TicTacToeGUI:
                 # If Human vs AI mode and AI's turn, make AI move
                 if self.mode == 'HvAI' and self.game.current_player != self.human_player:
                     self.ai_thinking = True
-                    self.root.after(300, self.make_ai_move)
+                    self.schedule_ai_turn()
     
     def make_ai_move(self):
-        """Make AI move."""
-        if not self.game.is_game_over:
-            move = best_move(self.game.get_board(), self.game.current_player)
-            if move:
-                self.game.make_move(move[0], move[1])
-                self.update_display()
-                
-                if self.game.is_game_over:
-                    self.highlight_winning_line()
-                    self.handle_game_over()
+        """Start the AI search on the worker thread; _apply_ai_move plays the result."""
+        if self.game.is_game_over:
+            self.ai_thinking = False
+            return
+        
+        gen = self._ai_gen
+        # The worker gets the position as two immutable ints: a snapshot
+        # without copying the board or converting it back to bitboards
+        game = self.game
+        future = self._pool.submit(self._best_move, game.x_bb, game.o_bb, game.current_player)
+        # Done callbacks run on the worker thread; hop back to Tk before touching
+        # widgets. Results already known to be stale (e.g. after close()) aren't posted.
+        future.add_done_callback(
+            lambda f: gen == self._ai_gen and self._after(0, self._apply_ai_move, gen, f))
+    
+    def _apply_ai_move(self, gen, future):
+        """Play a finished AI search, unless the game has moved on since it started."""
+        if gen != self._ai_gen:
+            return  # New game or mode change while searching
         
         self.ai_thinking = False
+        move = future.result()
+        if move and self.game.make_move(move[0], move[1]):
+            self.update_display()
+            
+            if self.game.is_game_over:
+                self.highlight_winning_line()
+                self.handle_game_over()
+    
+    def schedule_ai_turn(self):
+        """Arm the AI timer (300ms delay as specified); there is only ever one."""
+        self.cancel_ai_turn()
+        self._ai_job = self._after(300, self._ai_tick)
+    
+    def cancel_ai_turn(self):
+        """Drop the pending AI turn, if any, and any search already running."""
+        self._ai_gen += 1
+        if self._ai_job is not None:
+            self._after_cancel(self._ai_job)
+            self._ai_job = None
+    
+    def close(self):
+        """Stop the AI (timer and worker thread) and close the window."""
+        self.cancel_ai_turn()
+        self._pool.shutdown(wait=False)
+        self.root.destroy()
+    
+    def _ai_tick(self):
+        """Play one AI move, re-arming the timer while the AI keeps moving."""
+        self._ai_job = None
+        
+        # Too soon after the last move: come back once the interval is up
+        now = time.monotonic() * 1000
+        wait = self._last_tick_ms + AI_MIN_INTERVAL_MS - now
+        if wait > 0:
+            self._ai_job = self._after(int(wait) + 1, self._ai_tick)
+            return
+        self._last_tick_ms = now
+        
+        if self.ai_plan is not None:
+            self.play_planned_move()
+        else:
+            self.make_ai_move()
+        
+        if self.mode == 'AIvAI' and not self.game.is_game_over:
+            self._ai_job = self._after(300, self._ai_tick)
     
     def run_ai_vs_ai_game(self):
-        """Run one move in AI vs AI mode."""
-        if not self.game.is_game_over:
-            move = best_move(self.game.get_board(), self.game.current_player)
-            if move:
-                self.game.make_move(move[0], move[1])
-                self.update_display()
-                
-                if self.game.is_game_over:
-                    self.highlight_winning_line()
-                    self.handle_game_over()
-                else:
-                    # Schedule next move (300ms delay as specified)
-                    self.root.after(300, self.run_ai_vs_ai_game)
+        """Plan the whole AI vs AI game up front, then play it back."""
+        self.ai_plan = best_line(self.game)
+        self._plan_index = 0
+        self.schedule_ai_turn()
+    
+    def play_planned_move(self):
+        """Play the next precomputed AI vs AI move; no engine search happens here."""
+        if self.game.is_game_over:
+            return
+        
+        row, col = self.ai_plan[self._plan_index]
+        self._plan_index += 1
+        self.game.make_move(row, col)
+        self.update_display()
+        
+        if self.game.is_game_over:
+            self.ai_plan = None
+            self.highlight_winning_line()
+            self.handle_game_over()
     
     def update_display(self):
         """Update button text and status label."""
-        # Update button text
-        board = self.game.get_board()
-        for row in range(3):
-            for col in range(3):
-                cell_value = board[row][col]
-                if cell_value:
-                    self.buttons[row][col].config(text=cell_value, bg="SystemButtonFace")
-                    # Color coding
-                    if cell_value == 'X':
-                        self.buttons[row][col].config(fg="blue")
-                    else:
-                        self.buttons[row][col].config(fg="red")
-                else:
-                    self.buttons[row][col].config(text="", bg="SystemButtonFace")
+        with self._batched():
+            # Only reconfigure buttons whose cell changed since the last redraw;
+            # usually that is just the one cell that was played. The engine's
+            # board is read in place, without a get_board() copy.
+            rendered = self._rendered
+            for row, col, cell_value in self.game.iter_cells():
+                i = row * 3 + col
+                if cell_value != rendered[i]:
+                    rendered[i] = cell_value
+                    self.buttons[row][col].config(**CELL_STYLES[cell_value])
         
-        # Update status label
-        if self.game.is_game_over:
-            if self.game.winner:
-                self.status_label.config(
-                    text=f"Game Over! {self.game.winner} Wins!",
-                    fg="green"
-                )
-            else:
-                self.status_label.config(
-                    text="Game Over! It's a Tie!",
-                    fg="orange"
-                )
-        else:
-            mode_text = ""
-            if self.mode == 'HvH':
-                mode_text = " (Human vs Human)"
-            elif self.mode == 'HvAI':
-                if self.game.current_player == self.human_player:
-                    mode_text = " (Human)"
+            # Update status label
+            if self.game.is_game_over:
+                if self.game.winner:
+                    self.status_label.config(
+                        text=f"Game Over! {self.game.winner} Wins!",
+                        fg="green"
+                    )
                 else:
-                    mode_text = " (AI)"
+                    self.status_label.config(
+                        text="Game Over! It's a Tie!",
+                        fg="orange"
+                    )
             else:
-                mode_text = " (AI vs AI)"
+                mode_text = ""
+                if self.mode == 'HvH':
+                    mode_text = " (Human vs Human)"
+                elif self.mode == 'HvAI':
+                    if self.game.current_player == self.human_player:
+                        mode_text = " (Human)"
+                    else:
+                        mode_text = " (AI)"
+                else:
+                    mode_text = " (AI vs AI)"
             
-            self.status_label.config(
-                text=f"Current Player: {self.game.current_player}{mode_text}",
-                fg="black"
-            )
+                self.status_label.config(
+                    text=f"Current Player: {self.game.current_player}{mode_text}",
+                    fg="black"
+                )
     
     def highlight_winning_line(self):
-        """Highlight the winning line on the board."""
-        if not self.game.winner:
+        """Highlight the winning line the engine recorded on the board."""
+        if not self.game.winning_line:
             return
         
-        board = self.game.get_board()
-        winning_player = self.game.winner
-        
-        # Check rows
-        for row in range(3):
-            if all(board[row][col] == winning_player for col in range(3)):
-                for col in range(3):
-                    self.buttons[row][col].config(bg="yellow")
-                return
-        
-        # Check columns
-        for col in range(3):
-            if all(board[row][col] == winning_player for row in range(3)):
-                for row in range(3):
-                    self.buttons[row][col].config(bg="yellow")
-                return
-        
-        # Check diagonal (top-left to bottom-right)
-        if all(board[i][i] == winning_player for i in range(3)):
-            for i in range(3):
-                self.buttons[i][i].config(bg="yellow")
-            return
-        
-        # Check diagonal (top-right to bottom-left)
-        if all(board[i][2-i] == winning_player for i in range(3)):
-            for i in range(3):
-                self.buttons[i][2-i].config(bg="yellow")
-            return
+        with self._batched():
+            for row, col in self.game.winning_line:
+                self.buttons[row][col].config(bg="yellow")
     
     def update_scoreboard(self):
         """Update scoreboard display."""
@@ -319,23 +423,26 @@ class TicTacToeGUI:
     
     def new_game(self):
         """Start a new game (reset current game)."""
+        self.cancel_ai_turn()
         self.game.reset()
         self.ai_thinking = False
+        self.ai_plan = None
         self.update_display()
         
         # If AI vs AI mode, start the game
         if self.mode == 'AIvAI':
-            self.root.after(300, self.run_ai_vs_ai_game)
+            self.run_ai_vs_ai_game()
         # If Human vs AI and AI goes first
         elif self.mode == 'HvAI' and self.human_player == 'O':
             self.ai_thinking = True
-            self.root.after(300, self.make_ai_move)
+            self.schedule_ai_turn()
     
     def reset_scores(self):
         """Reset all scores to zero."""
         self.scores = {'X': 0, 'O': 0, 'Tie': 0}
         self.update_scoreboard()
-        messagebox.showinfo("Scores Reset", "All scores have been reset to 0")
+        # Shown until the next move redraws the status line; no modal dialog
+        self.status_label.config(text="All scores have been reset to 0", fg="black")
     
     def set_mode(self, mode, human_player='X'):
         """Set game mode and start new game."""
@@ -348,7 +455,8 @@ class TicTacToeGUI:
             'HvAI': f'Human ({human_player}) vs AI ({("O" if human_player == "X" else "X")})',
             'AIvAI': 'AI vs AI'
         }
-        messagebox.showinfo("Mode Changed", f"Mode set to: {mode_names[mode]}")
+        # Shown until the first move redraws the status line; no modal dialog
+        self.status_label.config(text=f"Mode set to: {mode_names[mode]}", fg="black")
 
 
 def main():
@@ -1,5 +1,7 @@
 from typing import List, Optional, Tuple
 
+from engine_kernels import NUMBA_AVAILABLE, best_bit_kernel
+
 # --- HELPER FUNCTIONS ---
 
 def check_winner(board: List[List[Optional[str]]]) -> Optional[str]:
@@ -9,24 +11,41 @@ def check_winner(board: List[List[Optional[str]]]) -> Optional[str]:
         return board[line[0][0]][line[0][1]]
     return None
 
+# Winning lines as flat cell indices (row * 3 + col): rows, columns, diagonals
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
 def get_winning_line(board: List[List[Optional[str]]]) -> Optional[List[Tuple[int, int]]]:
     """Returns the list of coordinates that form a win, or None."""
-    # Rows
-    for r in range(3):
-        if board[r][0] == board[r][1] == board[r][2] and board[r][0] is not None:
-            return [(r, 0), (r, 1), (r, 2)]
-    # Columns
-    for c in range(3):
-        if board[0][c] == board[1][c] == board[2][c] and board[0][c] is not None:
-            return [(0, c), (1, c), (2, c)]
-    # Diagonals
-    if board[0][0] == board[1][1] == board[2][2] and board[0][0] is not None:
-        return [(0, 0), (1, 1), (2, 2)]
-    if board[0][2] == board[1][1] == board[2][0] and board[0][2] is not None:
-        return [(0, 2), (1, 1), (2, 0)]
+    b = board[0] + board[1] + board[2]
+    for i, j, k in WIN_LINES:
+        v = b[i]
+        if v is not None and v == b[j] == b[k]:
+            return [divmod(i, 3), divmod(j, 3), divmod(k, 3)]
     
     return None
 
+# Bitmask form: bit (row * 3 + col) is set when a player owns that cell
+WIN_MASKS = tuple((1 << i) | (1 << j) | (1 << k) for i, j, k in WIN_LINES)
+FULL_MASK = 0x1FF
+
+def is_winner(mask: int) -> bool:
+    """True if the player whose cells are in mask has three in a row."""
+    for w in WIN_MASKS:
+        if mask & w == w: return True
+    return False
+
+def board_to_masks(board: List[List[Optional[str]]]) -> Tuple[int, int]:
+    """Returns (x_mask, o_mask) for a board."""
+    x_mask = o_mask = 0
+    for i, cell in enumerate(board[0] + board[1] + board[2]):
+        if cell == 'X': x_mask |= 1 << i
+        elif cell == 'O': o_mask |= 1 << i
+    return x_mask, o_mask
+
 def is_board_full(board: List[List[Optional[str]]]) -> bool:
     return all(all(cell is not None for cell in row) for row in board)
 
@@ -35,54 +54,150 @@ def get_legal_moves(board: List[List[Optional[str]]]) -> List[Tuple[int, int]]:
 
 # --- AI ENGINE ---
 
-def best_move(board: List[List[Optional[str]]], player: str) -> Tuple[int, int]:
-    opponent = 'O' if player == 'X' else 'X'
-
-    def minimax(current_board, depth, is_maximizing, alpha, beta):
-        winner = check_winner(current_board)
-        if winner == player: return 1
-        if winner == opponent: return -1
-        if is_board_full(current_board): return 0
-
-        if is_maximizing:
-            max_eval = -float('inf')
-            for r, c in get_legal_moves(current_board):
-                current_board[r][c] = player
-                eval = minimax(current_board, depth + 1, False, alpha, beta)
-                current_board[r][c] = None
-                max_eval = max(max_eval, eval)
-                alpha = max(alpha, eval)
-                if beta <= alpha: break
-            return max_eval
-        else:
-            min_eval = float('inf')
-            for r, c in get_legal_moves(current_board):
-                current_board[r][c] = opponent
-                eval = minimax(current_board, depth + 1, True, alpha, beta)
-                current_board[r][c] = None
-                min_eval = min(min_eval, eval)
-                beta = min(beta, eval)
-                if beta <= alpha: break
-            return min_eval
-
-    best_val = -float('inf')
-    best_move_found = None
-    
-    for r, c in get_legal_moves(board):
-        board[r][c] = player
-        move_val = minimax(board, 0, False, -float('inf'), float('inf'))
-        board[r][c] = None
+# Transposition table shared by every best_move call:
+# (mover's mask, other mask) -> exact negamax score for the side to move.
+# Scores don't depend on depth, so an entry is valid wherever the position recurs.
+_TT = {}
+
+# Move ordering inside the search: center, corners, then edges (as bits)
+ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+ORDER_BITS = tuple(1 << sq for sq in ORDER)
+
+# The board's 8 symmetries (4 rotations, each optionally mirrored) as square
+# maps, and PERMS[t][mask]: mask with transform t applied, in one lookup
+_ROT90 = (2, 5, 8, 1, 4, 7, 0, 3, 6)   # (r, c) -> (c, 2 - r)
+_MIRROR = (2, 1, 0, 5, 4, 3, 8, 7, 6)  # (r, c) -> (r, 2 - c)
+
+def _symmetries() -> List[Tuple[int, ...]]:
+    syms = []
+    t = tuple(range(9))
+    for _ in range(4):
+        syms.append(t)
+        syms.append(tuple(_MIRROR[sq] for sq in t))
+        t = tuple(_ROT90[sq] for sq in t)
+    return syms
+
+PERMS = tuple(
+    tuple(sum(1 << t[sq] for sq in range(9) if mask >> sq & 1) for mask in range(FULL_MASK + 1))
+    for t in _symmetries()
+)
+
+def canonical(me: int, opp: int) -> int:
+    """One key shared by a position and all its rotations/reflections."""
+    return min((p[me] << 9) | p[opp] for p in PERMS)
+
+# Integer bounds just outside the score range (-1..1), so the search never
+# compares its int scores against float infinities
+SCORE_MIN, SCORE_MAX = -2, 2
+
+def negamax(me: int, opp: int, alpha: int, beta: int) -> int:
+    """Score for the side to move (cells in me): 1 win, -1 loss, 0 tie."""
+    key = (me, opp)
+    cached = _TT.get(key)
+    if cached is not None: return cached
+
+    if is_winner(opp): return -1  # the last move won
+    free = FULL_MASK & ~(me | opp)
+    if not free: return 0
+
+    alpha_orig = alpha
+    value = SCORE_MIN
+    for bit in ORDER_BITS:
+        if not free & bit: continue
+        eval = -negamax(opp, me | bit, -beta, -alpha)
+        if eval > value:
+            value = eval
+            if eval > alpha: alpha = eval
+        if alpha >= beta: break
+
+    # A cutoff only bounds the score, so store exact results only: values
+    # inside the (alpha, beta) window, or bounds that are already +1/-1
+    if (alpha_orig < value or value == -1) and (value < beta or value == 1):
+        _TT[key] = value
+    return value
+
+def _best_bit(me: int, opp: int) -> int:
+    best_val = SCORE_MIN
+    best = -1
+    seen = set()
+    free = FULL_MASK & ~(me | opp)
+
+    for sq in range(9):
+        # Scanned row-major (not in ORDER) so ties go to the first cell from the top-left
+        bit = 1 << sq
+        if not free & bit: continue
+        child = me | bit
+        # A move leading to a mirror image of one already scored has the same
+        # value, so it could never beat that earlier (lower-index) move
+        key = canonical(opp, child)
+        if key in seen: continue
+        seen.add(key)
+
+        move_val = -negamax(opp, child, SCORE_MIN, SCORE_MAX)
         if move_val > best_val:
             best_val = move_val
-            best_move_found = (r, c)
+            best = sq
+
+    return best
+
+def _search_bit(x_mask: int, o_mask: int, side: str, use_kernel: bool = True) -> int:
+    """Numba kernel when numba is installed (and use_kernel), the Python search otherwise.
+
+    _build_opt_table passes use_kernel=False: the kernel has no TT and is
+    compiled on its first call, so for thousands of positions the Python
+    search with its shared _TT is far quicker.
+    """
+    me, opp = (x_mask, o_mask) if side == 'X' else (o_mask, x_mask)
+    if use_kernel and NUMBA_AVAILABLE: return best_bit_kernel(me, opp)
+    return _best_bit(me, opp)
+
+def _build_opt_table() -> dict:
+    """Solve every position reachable in play, depth-first from the empty board."""
+    table = {}
+    stack = [(0, 0)]
+    while stack:
+        x_mask, o_mask = stack.pop()
+        side = 'X' if bin(x_mask).count('1') == bin(o_mask).count('1') else 'O'
+        key = (x_mask, o_mask, side)
+        if key in table or is_winner(x_mask) or is_winner(o_mask): continue
+        free = FULL_MASK & ~(x_mask | o_mask)
+        if not free: continue
+        table[key] = _search_bit(x_mask, o_mask, side, use_kernel=False)
+        for sq in range(9):
+            bit = 1 << sq
+            if free & bit:
+                stack.append((x_mask | bit, o_mask) if side == 'X' else (x_mask, o_mask | bit))
+    return table
+
+# (x_mask, o_mask, side to move) -> best bit, for all 4520 positions reachable
+# in play. Built once at import, so in a game best_move is one dict lookup.
+OPT = _build_opt_table()
+
+def best_move_native(x_mask: int, o_mask: int, side: str) -> int:
+    """Best cell as a bit index (row * 3 + col) for side ('X' or 'O'), -1 if none.
+
+    Answered from OPT; anything else (e.g. the wrong side to move) is searched
+    and the result added to the table.
+    """
+    key = (x_mask, o_mask, side)
+    bit = OPT.get(key)
+    if bit is None:
+        bit = OPT[key] = _search_bit(x_mask, o_mask, side)
+    return bit
 
-    return best_move_found
+def best_move(board: List[List[Optional[str]]], player: str) -> Tuple[int, int]:
+    x_mask, o_mask = board_to_masks(board)
+    bit = best_move_native(x_mask, o_mask, player)
+    return divmod(bit, 3) if bit >= 0 else None
 
 # --- GAME CLASS ---
 
 class TicTacToe:
     def __init__(self):
         self.board: List[List[Optional[str]]] = [[None for _ in range(3)] for _ in range(3)]
+        self.x_mask: int = 0
+        self.o_mask: int = 0
+        self.moves_played: int = 0  # Board is full at 9, no rescan needed
         self.current_player: str = 'X'
         self.winner: Optional[str] = None
         self.winning_line: Optional[List[Tuple[int, int]]] = None
@@ -93,14 +208,21 @@ class TicTacToe:
             return False
 
         self.board[row][col] = self.current_player
+        self.moves_played += 1
+        bit = 1 << (row * 3 + col)
+        if self.current_player == 'X':
+            self.x_mask |= bit
+            mask = self.x_mask
+        else:
+            self.o_mask |= bit
+            mask = self.o_mask
         
         # Check Win/Tie
-        line = get_winning_line(self.board)
-        if line:
+        if is_winner(mask):
             self.winner = self.current_player
-            self.winning_line = line
+            self.winning_line = get_winning_line(self.board)
             self.is_game_over = True
-        elif is_board_full(self.board):
+        elif self.moves_played == 9:
             self.winner = None
             self.is_game_over = True
         else:
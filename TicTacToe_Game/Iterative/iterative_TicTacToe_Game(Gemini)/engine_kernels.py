@@ -0,0 +1,71 @@
+"""
+Integer-only search kernels for engine.py.
+
+Compiled to native code with numba when it is installed; engine.py only
+calls them then, and uses its own Python search (with the transposition
+table) otherwise. Masks use the same layout as engine.py: bit
+(row * 3 + col) is set when a player owns that cell.
+"""
+
+try:
+    from numba import njit  # optional
+except ImportError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+FULL_MASK = 0x1FF
+
+# Center, corners, then edges (engine.ORDER)
+ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+def _optional_njit(func):
+    """Compile func with numba when it is installed, otherwise return it unchanged.
+
+    Not cached to disk: numba's cache of a recursive function (negamax_kernel)
+    segfaults when a later run loads it back. Without a signature, numba
+    compiles on the first call, i.e. the first best_move_native miss.
+    """
+    if njit is None: return func
+    return njit(func)
+
+@_optional_njit
+def is_winner_kernel(mask: int) -> bool:
+    """engine.is_winner as one branch-free expression over the 8 line masks."""
+    return (((mask & 0o007) == 0o007) | ((mask & 0o070) == 0o070) | ((mask & 0o700) == 0o700) |
+            ((mask & 0o111) == 0o111) | ((mask & 0o222) == 0o222) | ((mask & 0o444) == 0o444) |
+            ((mask & 0o124) == 0o124) | ((mask & 0o421) == 0o421))
+
+@_optional_njit
+def negamax_kernel(me: int, opp: int, alpha: int, beta: int) -> int:
+    """engine.negamax without the transposition table: 1 win, -1 loss, 0 tie."""
+    if is_winner_kernel(opp): return -1  # the last move won
+    free = FULL_MASK & ~(me | opp)
+    if free == 0: return 0
+
+    value = -2
+    for sq in ORDER:
+        bit = 1 << sq
+        if free & bit == 0: continue
+        score = -negamax_kernel(opp, me | bit, -beta, -alpha)
+        if score > value:
+            value = score
+            if score > alpha: alpha = score
+        if alpha >= beta: break
+    return value
+
+@_optional_njit
+def best_bit_kernel(me: int, opp: int) -> int:
+    """Best cell (row * 3 + col) for the side owning me, or -1 if the board is full."""
+    best_val = -2
+    best = -1
+    free = FULL_MASK & ~(me | opp)
+    # Row-major, so ties go to the first cell from the top-left (as engine.best_move)
+    for sq in range(9):
+        bit = 1 << sq
+        if free & bit == 0: continue
+        score = -negamax_kernel(opp, me | bit, -2, 2)
+        if score > best_val:
+            best_val = score
+            best = sq
+    return best
@@ -1,11 +1,15 @@
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from tkinter import font
-from engine import TicTacToe, best_move
+from engine import TicTacToe, best_move_native
 
 class TicTacToeGUI:
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Tic-Tac-Toe")
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         
         # 1. Lock Window Size & Center it
         self.root.resizable(False, False)
@@ -20,6 +24,11 @@ class TicTacToeGUI:
         self.btn_font = font.Font(family="Helvetica", size=24, weight="bold")
         self.default_bg = "SystemButtonFace"
         self.buttons = [[None for _ in range(3)] for _ in range(3)]
+        self._batch_depth = 0
+        self._ai_job = None  # after() id of the pending AI turn
+        self._last_tick_ms = 0.0  # When the last AI tick played (monotonic ms)
+        self._pool = ThreadPoolExecutor(max_workers=1)  # AI searches run here
+        self._ai_gen = 0  # Bumped to discard searches still in flight
         
         self._create_menu()
         self._create_scoreboard()
@@ -45,6 +54,17 @@ class TicTacToeGUI:
         
         self.root.geometry(f'{width}x{height}+{x}+{y}')
 
+    @contextmanager
+    def _batched(self):
+        """Group widget updates; idle redraws are flushed once, when the outermost block ends."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.root.update_idletasks()
+
     def _create_menu(self):
         menubar = tk.Menu(self.root)
         
@@ -53,7 +73,7 @@ class TicTacToeGUI:
         game_menu.add_command(label="New Game", command=self.reset_game)
         game_menu.add_command(label="Reset Scores", command=self.reset_scores)
         game_menu.add_separator()
-        game_menu.add_command(label="Quit", command=self.root.quit)
+        game_menu.add_command(label="Quit", command=self.close)
         menubar.add_cascade(label="Game", menu=game_menu)
         
         # Mode Menu
@@ -75,11 +95,14 @@ class TicTacToeGUI:
     def _create_scoreboard(self):
         frame = tk.Frame(self.root)
         frame.pack(pady=5)
-        self.score_labels = {}
+        # Each label is bound to its own StringVar, so a score change only
+        # touches the one label whose count moved
+        self.score_vars = {}
         for key in ['X', 'O', 'Tie']:
-            lbl = tk.Label(frame, text=f"{key}: 0", font=("Arial", 12), width=8)
+            var = tk.StringVar(value=f"{key}: 0")
+            lbl = tk.Label(frame, textvariable=var, font=("Arial", 12), width=8)
             lbl.pack(side=tk.LEFT, padx=5)
-            self.score_labels[key] = lbl
+            self.score_vars[key] = var
 
     def _create_board(self):
         grid_frame = tk.Frame(self.root)
@@ -115,58 +138,105 @@ class TicTacToeGUI:
         self.execute_move(row, col)
         
         if not self.game.is_game_over and self.mode == "HvAI":
-            self.root.after(500, self.computer_move)
+            self._schedule_ai()
+
+    def _schedule_ai(self):
+        """Arm the single AI timer, replacing any turn already pending."""
+        self._cancel_ai()
+        self._ai_job = self.root.after(500, self._ai_tick)
+
+    def _cancel_ai(self):
+        self._ai_gen += 1
+        if self._ai_job is not None:
+            self.root.after_cancel(self._ai_job)
+            self._ai_job = None
+
+    def close(self):
+        """Stop the AI (timer and worker thread) and close the window."""
+        self._cancel_ai()
+        self._pool.shutdown(wait=False)
+        self.root.destroy()
+
+    def _ai_tick(self):
+        self._ai_job = None
+        # Never play AI moves closer than 250ms apart; come back if too soon
+        now = time.monotonic() * 1000
+        wait = self._last_tick_ms + 250 - now
+        if wait > 0:
+            self._ai_job = self.root.after(int(wait) + 1, self._ai_tick)
+            return
+        self._last_tick_ms = now
+        self.computer_move()
 
     def computer_move(self):
+        """Search on the worker thread; the move is played by _apply_ai_move."""
         if self.game.is_game_over: return
 
-        move = best_move(self.game.board, self.game.current_player)
-        if move:
-            self.execute_move(move[0], move[1])
-            
+        gen = self._ai_gen
+        game = self.game
+        # Masks are plain ints, so the worker gets a snapshot without copying the board
+        future = self._pool.submit(best_move_native, game.x_mask, game.o_mask, game.current_player)
+        future.add_done_callback(lambda f: self._search_done(gen, f))
+
+    def _search_done(self, gen, future):
+        """Runs on the worker thread: hand a still-wanted result back to Tk."""
+        if gen != self._ai_gen: return  # Reset while searching
+        self.root.after(0, self._apply_ai_move, gen, future)
+
+    def _apply_ai_move(self, gen, future):
+        """In AI vs AI the same timer is re-armed until game over."""
+        if gen != self._ai_gen: return  # Reset while searching
+
+        bit = future.result()
+        if bit >= 0:
+            self.execute_move(*divmod(bit, 3))
+
         if not self.game.is_game_over and self.mode == "AIvAI":
-            self.root.after(500, self.computer_move)
-        elif not self.game.is_game_over and self.mode == "HvAI" and self.game.current_player != self.human_side:
-             pass
+            self._ai_job = self.root.after(500, self._ai_tick)
 
     def execute_move(self, row, col):
         if self.game.make_move(row, col):
             player = self.game.board[row][col]
             color = "black" if player == "X" else "red"
-            self.buttons[row][col].config(text=player, state="disabled", disabledforeground=color)
-            
-            if self.game.is_game_over:
-                self.handle_game_over()
-            else:
-                self._update_status(f"Player {self.game.current_player}'s Turn")
+            with self._batched():
+                self.buttons[row][col].config(text=player, state="disabled", disabledforeground=color)
+                
+                if self.game.is_game_over:
+                    self.handle_game_over()
+                else:
+                    self._update_status(f"Player {self.game.current_player}'s Turn")
 
     def handle_game_over(self):
         if self.game.winner:
-            self.scores[self.game.winner] += 1
+            key = self.game.winner
             self._update_status(f"Winner: {self.game.winner}!")
             self.highlight_win()
         else:
-            self.scores['Tie'] += 1
+            key = 'Tie'
             self._update_status("It's a Tie!")
-        self._update_scoreboard()
+        self.scores[key] += 1
+        self.score_vars[key].set(f"{key}: {self.scores[key]}")
 
     def highlight_win(self):
         if self.game.winning_line:
-            for r, c in self.game.winning_line:
-                self.buttons[r][c].config(bg="#90EE90")
+            with self._batched():
+                for r, c in self.game.winning_line:
+                    self.buttons[r][c].config(bg="#90EE90")
 
     def reset_game(self):
+        self._cancel_ai()
         self.game.reset()
-        for r in range(3):
-            for c in range(3):
-                self.buttons[r][c].config(text="", state="normal", bg=self.default_bg)
-        
-        self._update_status("Player X's Turn")
+        with self._batched():
+            for r in range(3):
+                for c in range(3):
+                    self.buttons[r][c].config(text="", state="normal", bg=self.default_bg)
+            
+            self._update_status("Player X's Turn")
         
         if self.mode == "AIvAI":
-            self.root.after(500, self.computer_move)
+            self._schedule_ai()
         elif self.mode == "HvAI" and self.human_side == "O":
-            self.root.after(500, self.computer_move)
+            self._schedule_ai()
 
     def reset_scores(self):
         self.scores = {'X': 0, 'O': 0, 'Tie': 0}
@@ -174,7 +244,7 @@ class TicTacToeGUI:
 
     def _update_scoreboard(self):
         for key in self.scores:
-            self.score_labels[key].config(text=f"{key}: {self.scores[key]}")
+            self.score_vars[key].set(f"{key}: {self.scores[key]}")
 
     def _update_status(self, text):
         self.status_label.config(text=text)
@@ -6,7 +6,8 @@ Gemini chat link: https://gemini.google.com/share/b5b1a63f1fd1
 
 How to Run:
 -----------
-1. Ensure 'engine.py', 'gui.py', and 'main.py' are in the same directory.
+1. Ensure 'engine.py', 'engine_kernels.py', 'gui.py', and 'main.py' are in
+   the same directory.
 2. Run the command:
    $ python main.py
 
@@ -39,16 +40,18 @@ The AI uses the Minimax algorithm with Alpha-Beta pruning.
 
 File Structure:
 ---------------
-1. engine.py: Core logic, board state, validation, and Minimax AI.
-2. gui.py:    Tkinter visualization, event handling, and window management.
-3. main.py:   Entry point and documentation.
+1. engine.py:         Core logic, board state, validation, and Minimax AI.
+2. engine_kernels.py: Integer-only search kernels, compiled with numba when
+                      it is installed (optional; pure Python otherwise).
+3. gui.py:            Tkinter visualization, event handling, and window management.
+4. main.py:           Entry point and documentation.
 
 Limitations:
 ------------
 - The window size is locked to preserve the aspect ratio.
 - The AI has no difficulty setting; it is always perfect.
-- The AI move is calculated on the main thread (blocking), though 
-  imperceptible for the 3x3 search space.
+- The AI move is calculated on a worker thread and played back on the
+  Tk thread, so the window stays responsive while it searches.
 """
 
 import tkinter as tk
@@ -1,8 +1,89 @@
 # engine.py
 from __future__ import annotations
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+try:
+    from numba import njit  # optional: compiles the search to native code
+except ImportError:
+    njit = None
+
+# Board is only the public/GUI representation. Each public function converts
+# it once (one concatenation into a Flat, then _to_bits for the search), so
+# the list-of-lists layout costs nothing per search node.
 Board = List[List[str]]  # 3x3, each cell in {"X","O"," "}
+Flat = List[str]  # the same 9 cells row-major; index = r * 3 + c
+
+# The 8 winning lines as flat indices: rows, columns, diagonals
+LINES = ((0, 1, 2), (3, 4, 5), (6, 7, 8),
+         (0, 3, 6), (1, 4, 7), (2, 5, 8),
+         (0, 4, 8), (2, 4, 6))
+
+# The search keeps the board as two 9-bit ints, one per player, with bit
+# r * 3 + c set for each cell that player holds. WIN_MASKS are LINES as bits.
+# Inside the search players are ints too: 0 for X, 1 for O (PLAYERS[p] is the
+# mark), so the other player is just p ^ 1.
+PLAYERS = "XO"
+WIN_MASKS = tuple((1 << i) | (1 << j) | (1 << k) for i, j, k in LINES)
+FULL = 0x1FF
+
+# Move order below the root: center, corners, then edges. Strong moves first
+# give earlier alpha-beta cutoffs. The root keeps row-major order (ROW_MAJOR)
+# because its tie-break between equal moves depends on it.
+ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+ROW_MAJOR = tuple(range(9))
+
+# The 8 symmetries of the board (4 rotations, each with or without a mirror)
+# as cell permutations: SYMS[s][i] is where cell i goes. PERM_TBL[s][bits] is
+# a whole bitboard moved by SYMS[s], in one lookup.
+_ROT90 = (2, 5, 8, 1, 4, 7, 0, 3, 6)   # (r, c) -> (c, 2 - r)
+_MIRROR = (2, 1, 0, 5, 4, 3, 8, 7, 6)  # (r, c) -> (r, 2 - c)
+
+def _syms() -> Tuple[Tuple[int, ...], ...]:
+    syms = []
+    t = ROW_MAJOR
+    for _ in range(4):
+        syms.append(t)
+        syms.append(tuple(_MIRROR[i] for i in t))
+        t = tuple(_ROT90[i] for i in t)
+    return tuple(syms)
+
+SYMS = _syms()
+SYMS_INV = tuple(tuple(perm.index(i) for i in range(9)) for perm in SYMS)
+PERM_TBL = tuple(
+    tuple(sum(1 << perm[i] for i in range(9) if bits >> i & 1) for bits in range(FULL + 1))
+    for perm in SYMS
+)
+
+def canonical(x: int, o: int) -> Tuple[int, int]:
+    """Return (key, s): key is (x << 9) | o for the smallest of the position's
+    8 symmetric copies, and s the index into SYMS of the symmetry giving it."""
+    best = 1 << 18
+    best_s = 0
+    for s, tbl in enumerate(PERM_TBL):
+        key = tbl[x] << 9 | tbl[o]
+        if key < best:
+            best, best_s = key, s
+    return best, best_s
+
+def _has_line(bits: int) -> bool:
+    for m in WIN_MASKS:
+        if bits & m == m:
+            return True
+    return False
+
+# _has_line for every bitboard, so the search tests a win with one index
+# instead of a function call
+HAS_LINE = tuple(_has_line(bits) for bits in range(FULL + 1))
+
+def _to_bits(b: Flat) -> Tuple[int, int]:
+    """Return (x_bits, o_bits) for a flat board."""
+    x = o = 0
+    for i, cell in enumerate(b):
+        if cell == "X":
+            x |= 1 << i
+        elif cell == "O":
+            o |= 1 << i
+    return x, o
 
 def new_board() -> Board:
     """Return a fresh 3x3 board filled with spaces."""
@@ -20,26 +101,30 @@ def legal_moves(board: Board) -> List[Tuple[int, int]]:
                 moves.append((r, c))
     return moves
 
+def _winner_flat(b: Flat) -> Optional[str]:
+    for i, j, k in LINES:
+        a = b[i]
+        if a != " " and a == b[j] == b[k]:
+            return a
+    return None
+
 def winner(board: Board) -> Optional[str]:
     """Return 'X' or 'O' if there is a winner, else None."""
-    lines = []
-    # rows
-    for r in range(3):
-        lines.append(board[r])
-    # cols
-    for c in range(3):
-        lines.append([board[0][c], board[1][c], board[2][c]])
-    # diagonals
-    lines.append([board[0][0], board[1][1], board[2][2]])
-    lines.append([board[0][2], board[1][1], board[2][0]])
-    for line in lines:
-        if line[0] != " " and line.count(line[0]) == 3:
-            return line[0]
+    return _winner_flat(board[0] + board[1] + board[2])
+
+def winning_line(board: Board) -> Optional[Tuple[Tuple[int, int], ...]]:
+    """Return the three (row, col) cells of the winning line, or None if nobody has won."""
+    b = board[0] + board[1] + board[2]
+    for line in LINES:
+        i, j, k = line
+        if b[i] != " " and b[i] == b[j] == b[k]:
+            return tuple(divmod(n, 3) for n in line)
     return None
 
 def is_terminal(board: Board) -> bool:
     """Return True if the game is over (win or full board)."""
-    return winner(board) is not None or not any(cell == " " for row in board for cell in row)
+    b = board[0] + board[1] + board[2]
+    return _winner_flat(b) is not None or " " not in b
 
 def apply_move(board: Board, move: Tuple[int, int], player: str) -> Board:
     r, c = move
@@ -59,60 +144,234 @@ def evaluate_terminal(board: Board, perspective: str) -> int:
         return 0
     return 1 if w == perspective else -1
 
+# Transposition table, kept across best_move calls so later turns reuse earlier work:
+# (position key, player to move, perspective) -> (value, best flat index, flag),
+# with players as 0/1.
+# The flag says whether value is the exact score or only a bound on it.
+# Positions are stored under their canonical() form, so all symmetric copies
+# share one entry; the stored move is in the canonical orientation.
+EXACT, LOWER, UPPER = 0, 1, 2
+TT: Dict[Tuple[int, int, int], Tuple[int, Optional[int], int]] = {}
+
 def minimax(board: Board, player: str, perspective: str, alpha: int, beta: int, depth: int = 0) -> Tuple[int, Optional[Tuple[int, int]]]:
     """Return (value, move) using minimax with alpha-beta pruning.
     - value is from the perspective player's point of view (the 'perspective' at the root).
     - move is the best move found at this node; None for terminal nodes.
     Tie-breaking: when values are equal, prefer the move with the smallest (row, col) in row-major order.
+    The root scans moves row-major and only a strictly better value replaces the
+    best so far, so the first optimal move found is that smallest one. (Nodes
+    below the root scan center-first, but only their values are used.)
     Depth increases by 1 each ply; used only for debugging or future enhancements.
     Pruning conditions:
       - Alpha represents the best guaranteed score for the maximizing side encountered so far.
       - Beta represents the best guaranteed score for the minimizing side encountered so far.
       - If alpha >= beta, remaining branches cannot influence the result and are pruned.
     """
+    x, o = _to_bits(board[0] + board[1] + board[2])
     # Terminal node: return the terminal score
-    if is_terminal(board):
-        return evaluate_terminal(board, perspective), None
+    if _has_line(x):
+        return (1 if perspective == "X" else -1), None
+    if _has_line(o):
+        return (1 if perspective == "O" else -1), None
+    value, idx = _minimax_bits(x, o, ~(x | o) & FULL, PLAYERS.index(player), PLAYERS.index(perspective), alpha, beta, depth)
+    return value, (divmod(idx, 3) if idx is not None else None)
 
-    moves = legal_moves(board)  # deterministic order ensures stable tie-breaking
+def _minimax_bits(x: int, o: int, empty: int, player: int, perspective: int, alpha: int, beta: int, depth: int) -> Tuple[int, Optional[int]]:
+    """minimax() on bitboards with 0/1 players; the move is returned as a flat index.
+    A move is one bit OR-ed into an int argument, so no board is copied or
+    allocated per node and there is nothing to undo on the way back up.
+    empty is the mask of free cells, passed down rather than recomputed.
+    The position must not already be won: wins are caught in the move loop,
+    on the one line set that just changed, before recursing.
+    """
+    # Full board: a tie
+    if not empty:
+        return 0, None
+
+    # Probe the TT. Not at the root (depth 0): a bound there would narrow the
+    # window and could change which of several equal moves gets picked.
+    # canonical(x, o), inlined: this runs at every node
+    pos = 1 << 18
+    sym = 0
+    for s, tbl in enumerate(PERM_TBL):
+        k = tbl[x] << 9 | tbl[o]
+        if k < pos:
+            pos, sym = k, s
+    key = (pos, player, perspective)
+    if depth > 0:
+        entry = TT.get(key)
+        if entry is not None:
+            value, move, flag = entry
+            if move is not None:
+                move = SYMS_INV[sym][move]  # back to this orientation
+            if flag == EXACT:
+                return value, move
+            if flag == LOWER:
+                if value > alpha:
+                    alpha = value
+            elif value < beta:
+                beta = value
+            if alpha >= beta:
+                return value, move
+    alpha_start, beta_start = alpha, beta
 
     # Maximize when current player == perspective; otherwise minimize.
     maximizing = (player == perspective)
+    # Hoisted out of the move loop: the side to move next and its bitboard
+    other = player ^ 1
+    mine = o if player else x
 
     best_value = -2 if maximizing else 2  # values are in {-1, 0, 1}
-    best_move: Optional[Tuple[int, int]] = None
+    best_move: Optional[int] = None
 
-    for mv in moves:
-        child = apply_move(board, mv, player)
-        # Recurse for opponent; depth+1 for clarity
-        val, _ = minimax(child, opponent(player), perspective, alpha, beta, depth + 1)
+    seen = set() if depth == 0 else None
+    for mv in (ROW_MAJOR if depth == 0 else ORDER):
+        bit = 1 << mv
+        if not empty & bit:
+            continue
+        if depth == 0:
+            # Moves that are mirror images of an earlier one score the same,
+            # and the earlier one wins the row-major tie-break, so skip them
+            # (on an empty board only 3 of the 9 moves are searched).
+            child = canonical(x, o | bit)[0] if player else canonical(x | bit, o)[0]
+            if child in seen:
+                continue
+            seen.add(child)
+        # A winning move ends the game; otherwise recurse for opponent, depth+1 for clarity
+        if HAS_LINE[mine | bit]:
+            val = 1 if maximizing else -1
+        elif player:
+            val, _ = _minimax_bits(x, o | bit, empty ^ bit, other, perspective, alpha, beta, depth + 1)
+        else:
+            val, _ = _minimax_bits(x | bit, o, empty ^ bit, other, perspective, alpha, beta, depth + 1)
 
         if maximizing:
-            if val > best_value or (val == best_value and (best_move is None or mv < best_move)):
+            if val > best_value:
                 best_value, best_move = val, mv
             # Update alpha for maximizing player and check prune
-            alpha = max(alpha, best_value)
+            if best_value > alpha:
+                alpha = best_value
             if alpha >= beta:
                 # prune remaining siblings
                 break
         else:
-            if val < best_value or (val == best_value and (best_move is None or mv < best_move)):
+            if val < best_value:
                 best_value, best_move = val, mv
             # Update beta for minimizing player and check prune
-            beta = min(beta, best_value)
+            if best_value < beta:
+                beta = best_value
             if alpha >= beta:
                 # prune remaining siblings
                 break
 
+    # A value outside the window only bounds the true score, unless it is
+    # already the best (+1) or worst (-1) score possible
+    if best_value <= alpha_start and best_value != -1:
+        flag = UPPER
+    elif best_value >= beta_start and best_value != 1:
+        flag = LOWER
+    else:
+        flag = EXACT
+    TT[key] = (best_value, SYMS[sym][best_move] if best_move is not None else None, flag)
+    return best_value, best_move
+
+def _minimax_nb(x: int, o: int, empty: int, player: int, perspective: int, alpha: int, beta: int, depth: int) -> Tuple[int, int]:
+    """_minimax_bits() with numba; the move is -1 at terminal nodes. No transposition table, since a compiled
+    search is fast enough without one; the result is the same.
+    Only compiled when numba is installed (see best_move).
+    """
+    # Full board: a tie
+    if empty == 0:
+        return 0, -1
+
+    maximizing = player == perspective
+    best_value = -2 if maximizing else 2
+    best_move = -1
+    for mv in (ROW_MAJOR if depth == 0 else ORDER):
+        bit = 1 << mv
+        if empty & bit == 0:
+            continue
+        mine = (x if player == 0 else o) | bit
+        won = False
+        for m in WIN_MASKS:
+            if mine & m == m:
+                won = True
+                break
+        if won:
+            val = 1 if maximizing else -1
+        elif player == 0:
+            val, _ = _minimax_nb(x | bit, o, empty ^ bit, 1, perspective, alpha, beta, depth + 1)
+        else:
+            val, _ = _minimax_nb(x, o | bit, empty ^ bit, 0, perspective, alpha, beta, depth + 1)
+
+        # Same tie-break and pruning as _minimax_bits
+        if maximizing:
+            if val > best_value:
+                best_value, best_move = val, mv
+            alpha = max(alpha, best_value)
+        else:
+            if val < best_value:
+                best_value, best_move = val, mv
+            beta = min(beta, best_value)
+        if alpha >= beta:
+            break
     return best_value, best_move
 
+if njit is not None:
+    # Not cache=True: numba's on-disk cache of a recursive function crashes
+    # when a later run loads it back. Without a signature numba compiles on
+    # the first call, i.e. the first POLICY miss, never at import.
+    _minimax_nb = njit(_minimax_nb)
+
+def _search(x: int, o: int, player: int, use_nb: bool = True) -> int:
+    """Best flat index for player (0/1) on a non-terminal position, by full search.
+    _build_policy passes use_nb=False: for the whole game, _minimax_bits and its
+    transposition table are much quicker than compiling the TT-less _minimax_nb.
+    """
+    if use_nb and njit is not None:
+        _, idx = _minimax_nb(x, o, ~(x | o) & FULL, player, player, -2, 2, 0)
+    else:
+        _, idx = _minimax_bits(x, o, ~(x | o) & FULL, player, player, -2, 2, 0)
+    # idx cannot be None/-1 because board not terminal, but be safe
+    return idx if idx is not None else -1
+
+# The solved game: (x_bits, o_bits, player to move as 0/1) -> best flat index, for
+# every non-terminal position reachable from the empty board (X moves first).
+# Filled on the first best_move call.
+POLICY: Dict[Tuple[int, int, int], int] = {}
+
+def _build_policy() -> None:
+    """Search every reachable position once, depth-first from the empty board."""
+    stack = [(0, 0)]
+    while stack:
+        x, o = stack.pop()
+        player = bin(x).count("1") - bin(o).count("1")  # 0: X to move, 1: O
+        key = (x, o, player)
+        if key in POLICY or _has_line(x) or _has_line(o) or x | o == FULL:
+            continue
+        POLICY[key] = _search(x, o, player, use_nb=False)
+        empty = ~(x | o) & FULL
+        for mv in ROW_MAJOR:
+            bit = 1 << mv
+            if empty & bit:
+                stack.append((x, o | bit) if player else (x | bit, o))
+
 def best_move(board: Board, player: str) -> Tuple[int, int]:
     """Return the optimal move for 'player' on 'board'.
     Deterministic: no randomness; row-major tie-breaking.
     If no legal moves exist (terminal), returns (-1, -1).
+    Reachable positions are answered from POLICY; anything else (e.g. the
+    other player to move) is searched and then added to it.
     """
-    if is_terminal(board):
+    # Convert once; the lookup or search then runs on the bitboards
+    x, o = _to_bits(board[0] + board[1] + board[2])
+    if _has_line(x) or _has_line(o) or x | o == FULL:
         return (-1, -1)
-    _, mv = minimax(board, player, perspective=player, alpha=-2, beta=2, depth=0)
-    # mv cannot be None because board not terminal, but be safe
-    return mv if mv is not None else (-1, -1)
+    if not POLICY:
+        _build_policy()
+    side = 0 if player == "X" else 1
+    key = (x, o, side)
+    idx = POLICY.get(key)
+    if idx is None:
+        idx = POLICY[key] = _search(x, o, side)
+    return divmod(idx, 3) if idx >= 0 else (-1, -1)
@@ -1,5 +1,6 @@
 # gui.py
 from __future__ import annotations
+import concurrent.futures
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
 from typing import Optional, Tuple
@@ -17,12 +18,28 @@ class TicTacToeApp:
 
         # Game state
         self.board = engine.new_board()
-        self.current_player = "X"
+        self.current_player_idx = 0  # 0: X, 1: O (engine.PLAYERS)
         self.mode = MODE_HH
         self.human_side = "X"  # relevant only in HA mode
         self.scores = {"X": 0, "O": 0, "Tie": 0}
         self.game_over = False
         self.ai_thinking = False
+        self.move_count = 0  # marks on the board; 9 means full
+
+        # AI searches run on this worker thread, off the Tk main loop. A result
+        # is only applied if _ai_gen hasn't changed since it was requested
+        # (New Game and mode changes bump it, so a search for the old
+        # board or mode is dropped).
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._ai_gen = 0
+        self._ai_job: Optional[str] = None  # pending after() for _ai_move_once
+
+        # What the buttons currently show, so _refresh_board only touches
+        # cells that changed (and the rest only when disable_all flips)
+        self._rendered = [[" "] * 3 for _ in range(3)]
+        self._last_disable: Optional[bool] = None
+        # Cells of the winning line, set once when the game is won
+        self._win_cells: frozenset = frozenset()
 
         # UI
         self._build_menu()
@@ -31,6 +48,11 @@ class TicTacToeApp:
         # Start if AI must move first
         self._maybe_ai_turn()
 
+    @property
+    def current_player(self) -> str:
+        """The mark ("X" or "O") of the player to move."""
+        return engine.PLAYERS[self.current_player_idx]
+
     def _build_menu(self) -> None:
         menubar = tk.Menu(self.root)
 
@@ -62,6 +84,12 @@ class TicTacToeApp:
         score_label = ttk.Label(outer, textvariable=self.score_var, font=("TkDefaultFont", 10, "bold"))
         score_label.grid(row=0, column=0, columnspan=3, pady=(0, 8))
 
+        # Winning-line cells use this style; the map covers the disabled
+        # state, since every button is disabled once the game is over
+        style = ttk.Style()
+        style.configure("Win.TButton", background="#8fd18f")
+        style.map("Win.TButton", background=[("disabled", "#8fd18f")])
+
         # Board grid
         self.buttons = [[None for _ in range(3)] for _ in range(3)]
         for r in range(3):
@@ -80,6 +108,7 @@ class TicTacToeApp:
 
     def set_mode(self, new_mode: str) -> None:
         """Switch modes mid-app and update status appropriately."""
+        self._cancel_ai_turn()  # a turn scheduled for the old mode
         self.mode = new_mode
         if self.mode == MODE_HA:
             # Choose human side
@@ -124,6 +153,7 @@ class TicTacToeApp:
 
         # Make human move
         self.board[r][c] = self.current_player
+        self.move_count += 1
         self._post_move()
 
     def _post_move(self) -> None:
@@ -131,11 +161,16 @@ class TicTacToeApp:
         w = engine.winner(self.board)
         if w is not None:
             self.game_over = True
+            self._win_cells = frozenset(engine.winning_line(self.board))
+            # Force a pass over every cell: the board may already be
+            # disabled (AI's turn), which would leave the line unstyled
+            self._last_disable = None
+            self._refresh_board()  # disable the board and highlight the line
             self.scores[w] += 1
             self._update_scoreboard()
             self._update_status(f"{w} wins")
             return
-        if all(cell != " " for row in self.board for cell in row):
+        if self.move_count == 9:
             self.game_over = True
             self.scores["Tie"] += 1
             self._update_scoreboard()
@@ -143,56 +178,84 @@ class TicTacToeApp:
             return
 
         # Switch player and maybe trigger AI
-        self.current_player = "O" if self.current_player == "X" else "X"
+        self.current_player_idx ^= 1
         self._update_status()
         self._maybe_ai_turn()
 
     def _maybe_ai_turn(self) -> None:
         """If current turn belongs to AI (in HA or AA), schedule AI to move via after()."""
-        if self.game_over:
-            return
+        if self.game_over or self.ai_thinking:
+            return  # over, or this turn is already scheduled
         if self.mode == MODE_HH:
             return
         if self.mode == MODE_HA and self.current_player != self.human_side:
             self.ai_thinking = True
             # Non-blocking: compute shortly after so UI stays responsive
-            self.root.after(10, self._ai_move_once)
+            self._ai_job = self.root.after(10, self._ai_move_once)
         elif self.mode == MODE_AA:
             self.ai_thinking = True
-            self.root.after(10, self._ai_move_once)
+            self._ai_job = self.root.after(10, self._ai_move_once)
+
+    def _cancel_ai_turn(self) -> None:
+        """Drop a scheduled AI turn and any search still running for it."""
+        self._ai_gen += 1
+        if self._ai_job is not None:
+            self.root.after_cancel(self._ai_job)
+            self._ai_job = None
+        self.ai_thinking = False
 
     def _ai_move_once(self) -> None:
-        """Make exactly one AI move (for current_player), then post-move. For AA, this will chain."""
+        """Start the search for one AI move (for current_player) on the worker thread."""
+        self._ai_job = None
         if self.game_over:
             self.ai_thinking = False
             return
 
-        # Compute best move deterministically
-        move = engine.best_move(self.board, self.current_player)
+        # Compute best move deterministically, on a copy so the search never
+        # sees the board change under it
+        gen = self._ai_gen
+        fut = self._executor.submit(engine.best_move, engine.copy_board(self.board), self.current_player)
+        # The callback runs on the worker thread; hand the result to Tk's thread
+        fut.add_done_callback(lambda f: self.root.after(0, self._apply_ai_move, gen, f))
+
+    def _apply_ai_move(self, gen: int, fut: concurrent.futures.Future) -> None:
+        """Play the move found by _ai_move_once, then post-move. For AA, _post_move chains the next turn."""
+        if gen != self._ai_gen:
+            return  # stale: the board was reset while the search ran
+        if self.game_over:
+            self.ai_thinking = False
+            return
+        move = fut.result()
         if move == (-1, -1):
             # Terminal safeguard
             self.ai_thinking = False
             return
         r, c = move
+        if self.board[r][c] != " ":
+            # Not a move for this board; leave the turn to whoever owns it
+            self.ai_thinking = False
+            return
         self.board[r][c] = self.current_player
+        self.move_count += 1
         self.ai_thinking = False
         self._post_move()
 
-        # If still AI's turn in AA mode, schedule next step
-        if not self.game_over and self.mode == MODE_AA:
-            self._maybe_ai_turn()
-
     def _refresh_board(self) -> None:
-        for r in range(3):
-            for c in range(3):
-                self.buttons[r][c]["text"] = self.board[r][c]
-
         # Disable all buttons when terminal or when AI's turn in HA/AA
         disable_all = self.game_over or (self.mode != MODE_HH and (self.mode == MODE_AA or self.current_player != self.human_side))
+        flipped = disable_all != self._last_disable
+        self._last_disable = disable_all
         for r in range(3):
             for c in range(3):
-                state = tk.DISABLED if disable_all or self.board[r][c] != " " else tk.NORMAL
+                cell = self.board[r][c]
+                if cell != self._rendered[r][c]:
+                    self._rendered[r][c] = cell
+                    self.buttons[r][c]["text"] = cell
+                elif not flipped:
+                    continue  # unchanged cell, unchanged state
+                state = tk.DISABLED if disable_all or cell != " " else tk.NORMAL
                 self.buttons[r][c]["state"] = state
+                self.buttons[r][c]["style"] = "Win.TButton" if (r, c) in self._win_cells else "TButton"
 
     def _update_status(self, result: Optional[str] = None) -> None:
         if result:
@@ -207,9 +270,12 @@ class TicTacToeApp:
     # Menu commands
     def menu_new_game(self) -> None:
         """Start a new round, preserve scores."""
+        self._cancel_ai_turn()  # drop any AI move still being searched
         self.board = engine.new_board()
-        self.current_player = "X"
+        self.move_count = 0
+        self.current_player_idx = 0
         self.game_over = False
+        self._win_cells = frozenset()
         self._refresh_board()
         self._update_status()
         self._maybe_ai_turn()
@@ -231,3 +297,4 @@ def launch() -> None:
         pass
     app = TicTacToeApp(root)
     root.mainloop()
+    app._executor.shutdown(wait=False)
@@ -5,7 +5,7 @@ README — Perfect-Play Tic-Tac-Toe (tkinter)
 
 How to run
 ----------
-Python 3.10+ required. No third-party packages.
+Python 3.10+ required. No third-party packages (numba is used if installed, see below).
 Run from a terminal:
 
     python main.py
@@ -29,21 +29,28 @@ the engine uses a stable row-major tie-break rule (top-left to bottom-right), gu
 Implementation overview
 -----------------------
 - engine.py contains the pure game logic and search:
-  - `legal_moves(board)`, `winner(board)`, `is_terminal(board)`
+  - `legal_moves(board)`, `winner(board)`, `winning_line(board)`, `is_terminal(board)`
   - `best_move(board, player)` computes the perfect move using `minimax(...)` with alpha-beta pruning.
+  - The first `best_move` call solves every reachable position into `engine.POLICY`; later calls are a lookup.
+  - Searched positions are cached in a transposition table (`engine.TT`) that persists across moves,
+    with rotations and reflections of a position sharing one entry.
+  - If numba is installed, positions missing from `POLICY` are searched by a compiled copy of the
+    search (`_minimax_nb`), compiled on the first such search; normal play never needs it.
   - Terminal evaluation only: +1 win, -1 loss, 0 tie, from the root player's perspective.
   - Inline comments document recursion depth handling and pruning conditions.
 - gui.py builds the tkinter interface:
   - Menu bar (Game: New, Reset Scores, Quit; Mode: H-H, H-A, A-A)
   - Status bar indicating current player, mode, and results
+  - The winning line is highlighted in green (`engine.winning_line`)
   - Scoreboard tracking X, O, and ties
-  - Non-blocking UI: AI turns are scheduled via `root.after(...)` so the app stays responsive.
+  - Non-blocking UI: AI searches run on a worker thread (`concurrent.futures`) and the move is
+    applied back on the Tk thread via `root.after(0, ...)`, so the app stays responsive.
 - main.py is the entry point and just launches the GUI.
 
 Known limitations
 -----------------
 - No undo/redo (stretch goal).
-- Very small codebase, so there’s no theme customizer or animation. You can add a winning-line highlight as a stretch.
+- Very small codebase, so there’s no theme customizer or animation.
 
 Testing the engine headlessly
 -----------------------------
@@ -15,6 +15,9 @@ DETERMINISM:
 
 IMPLEMENTATION:
     - Engine class: game logic, Minimax with alpha-beta pruning
+    - BEST_MOVE: the whole game solved once at import, so AI moves are lookups
+    - If numba is installed, searches off the table run a compiled copy
+      of the search (_minimax_kernel), compiled on the first such search
     - TicTacToeGUI class: tkinter interface with menu bar
     - Perfect play guaranteed via exhaustive search with pruning
 
@@ -23,11 +26,76 @@ LIMITATIONS:
     - X always moves first
 """
 
+from functools import partial
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-from typing import Optional, Tuple, List
+from typing import Dict, Iterator, List, Optional, Tuple
 from enum import Enum
 
+try:
+    from numba import njit  # optional: compiles the search to native code
+except ImportError:
+    njit = None
+
+
+# Winning lines as 9-bit masks; cell (r, c) is bit r * 3 + c
+WIN_MASKS = (0b111000000, 0b000111000, 0b000000111,
+             0b100100100, 0b010010010, 0b001001001,
+             0b100010001, 0b001010100)
+FULL_BOARD = 0x1FF
+
+# Search order below the root: center, corners, then edges. Strong moves
+# first means earlier alpha-beta cutoffs; the root stays row-major.
+ORDERED_BITS = tuple(1 << i for i in (4, 0, 2, 6, 8, 1, 3, 5, 7))
+
+# WIN_LOOKUP[bits] is True if that set of cells holds a complete line, so a
+# win test is one index instead of a loop over WIN_MASKS
+WIN_LOOKUP = tuple(any((bits & mask) == mask for mask in WIN_MASKS)
+                   for bits in range(FULL_BOARD + 1))
+
+
+def _symmetries() -> List[Tuple[int, ...]]:
+    """The 8 rotations and reflections of the board as cell permutations:
+    perm[i] is where cell i goes"""
+    rot90 = tuple(c * 3 + 2 - r for r in range(3) for c in range(3))   # (r, c) -> (c, 2 - r)
+    mirror = tuple(r * 3 + 2 - c for r in range(3) for c in range(3))  # (r, c) -> (r, 2 - c)
+    perms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append(tuple(mirror[i] for i in perm))
+        perm = tuple(rot90[i] for i in perm)
+    return perms
+
+
+# PERM_BITS[s][bits] is a bitboard moved by symmetry s, in one lookup.
+# Symmetric positions have the same score, so the transposition table
+# keys them all on one canonical() form.
+PERM_BITS = tuple(tuple(sum(1 << perm[i] for i in range(9) if bits >> i & 1)
+                        for bits in range(FULL_BOARD + 1))
+                  for perm in _symmetries())
+
+
+def canonical(x_bits: int, o_bits: int) -> int:
+    """Smallest state key (x_bits | o_bits << 9) over the board's 8 symmetries"""
+    best = 1 << 18
+    for perm_bits in PERM_BITS:
+        key = perm_bits[x_bits] | perm_bits[o_bits] << 9
+        if key < best:
+            best = key
+    return best
+
+# Players inside the search are small ints (0 for X, 1 for O), so the hot
+# path compares ints; the "X"/"O" strings only appear at the API boundary
+SIDE_X, SIDE_O = 0, 1
+
+# Transposition table flags: score is exact, a lower bound, or an upper bound
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# Alpha-beta bounds: scores are only -1, 0 or 1, so +/-2 act as infinity
+# while keeping every comparison int to int
+NEG_INF, POS_INF = -2, 2
+
 
 class GameMode(Enum):
     """Game mode enumeration"""
@@ -40,6 +108,9 @@ class Engine:
     """
     Pure game logic engine with Minimax AI.
     Fully testable without GUI.
+    
+    The board is two 9-bit ints, x_bits and o_bits, with bit r * 3 + c set
+    where that player has a mark.
     """
     
     EMPTY = " "
@@ -48,11 +119,36 @@ class Engine:
     
     def __init__(self):
         """Initialize empty 3x3 board"""
-        self.board: List[List[str]] = [[self.EMPTY] * 3 for _ in range(3)]
+        self.x_bits = 0
+        self.o_bits = 0
+        # (canonical key, AI side, is_maximizing) -> (score, flag); kept
+        # across games since a position's score never changes
+        self.tt: Dict[Tuple[int, int, bool], Tuple[int, int]] = {}
     
     def reset(self) -> None:
         """Clear the board"""
-        self.board = [[self.EMPTY] * 3 for _ in range(3)]
+        self.x_bits = 0
+        self.o_bits = 0
+    
+    def cell(self, row: int, col: int) -> str:
+        """Return the mark at (row, col): X, O or EMPTY"""
+        bit = 1 << (row * 3 + col)
+        if self.x_bits & bit:
+            return self.X
+        if self.o_bits & bit:
+            return self.O
+        return self.EMPTY
+    
+    def _side(self, player: str) -> int:
+        """SIDE_X or SIDE_O for the player's mark"""
+        return SIDE_X if player == self.X else SIDE_O
+    
+    def _place(self, bit: int, side: int) -> None:
+        """Toggle side's mark on the cell given as a bit (place or undo)"""
+        if side == SIDE_X:
+            self.x_bits ^= bit
+        else:
+            self.o_bits ^= bit
     
     def make_move(self, row: int, col: int, player: str) -> bool:
         """
@@ -61,122 +157,319 @@ class Engine:
         """
         if not (0 <= row < 3 and 0 <= col < 3):
             return False
-        if self.board[row][col] != self.EMPTY:
+        bit = 1 << (row * 3 + col)
+        if (self.x_bits | self.o_bits) & bit:
             return False
-        self.board[row][col] = player
+        self._place(bit, self._side(player))
         return True
     
-    def legal_moves(self) -> List[Tuple[int, int]]:
-        """Return list of (row, col) for empty cells"""
-        moves = []
-        for r in range(3):
-            for c in range(3):
-                if self.board[r][c] == self.EMPTY:
-                    moves.append((r, c))
-        return moves
+    def legal_moves(self) -> Iterator[Tuple[int, int]]:
+        """Yield (row, col) for each empty cell, in row-major order"""
+        free = ~(self.x_bits | self.o_bits) & FULL_BOARD
+        while free:
+            bit = free & -free  # lowest empty cell first: row-major order
+            free ^= bit
+            yield divmod(bit.bit_length() - 1, 3)
+    
+    def has_legal_move(self) -> bool:
+        """Return True if any cell is empty"""
+        return (self.x_bits | self.o_bits) != FULL_BOARD
     
     def is_terminal(self) -> bool:
         """Check if game is over (win or tie)"""
-        return self.winner() is not None or len(self.legal_moves()) == 0
+        winner, full = self._terminal_state()
+        return winner is not None or full
+    
+    def _terminal_state(self) -> Tuple[Optional[str], bool]:
+        """Return (winner or None, board is full) from one read of the board"""
+        x_bits, o_bits = self.x_bits, self.o_bits
+        if WIN_LOOKUP[x_bits]:
+            winner = self.X
+        elif WIN_LOOKUP[o_bits]:
+            winner = self.O
+        else:
+            winner = None
+        return winner, (x_bits | o_bits) == FULL_BOARD
     
     def winner(self) -> Optional[str]:
         """
         Return winning player (X or O) or None.
-        Checks rows, columns, and diagonals.
+        Checks rows, columns, and diagonals (via WIN_LOOKUP).
         """
-        # Check rows
-        for row in self.board:
-            if row[0] == row[1] == row[2] != self.EMPTY:
-                return row[0]
-        
-        # Check columns
-        for c in range(3):
-            if self.board[0][c] == self.board[1][c] == self.board[2][c] != self.EMPTY:
-                return self.board[0][c]
-        
-        # Check diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != self.EMPTY:
-            return self.board[1][1]
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != self.EMPTY:
-            return self.board[1][1]
-        
+        if WIN_LOOKUP[self.x_bits]:
+            return self.X
+        if WIN_LOOKUP[self.o_bits]:
+            return self.O
         return None
     
+    def state_key(self) -> int:
+        """Pack the board into one int: x_bits in bits 0-8, o_bits in 9-17"""
+        return self.x_bits | self.o_bits << 9
+    
     def best_move(self, player: str) -> Tuple[int, int]:
         """
         Find best move using Minimax with alpha-beta pruning.
         Returns (row, col) tuple.
         Deterministic: breaks ties by selecting top-left to bottom-right.
+        Positions reachable in play are looked up in BEST_MOVE; anything
+        else is searched. BEST_MOVE includes the empty board and every
+        one-mark opening, so the opening replies are never searched.
         """
-        best_score = float('-inf')
-        best_move_coords = None
+        move = BEST_MOVE.get((self.state_key(), player))
+        if move is not None:
+            return move
+        return self._search_best_move(player)
+    
+    def _search_best_move(self, player: str) -> Tuple[int, int]:
+        """best_move by full search from the current board"""
+        best_score = NEG_INF
+        best_bit = None
+        side = self._side(player)
+        if side == SIDE_X:
+            ai_bits, opp_bits = self.x_bits, self.o_bits
+        else:
+            ai_bits, opp_bits = self.o_bits, self.x_bits
+        free = ~(ai_bits | opp_bits) & FULL_BOARD
+        if WIN_LOOKUP[ai_bits] or WIN_LOOKUP[opp_bits]:
+            # Already decided: every move scores the same, so the
+            # tie-break picks the first empty cell
+            return next(self.legal_moves(), None)
         
-        # Try moves in row-major order for deterministic tie-breaking
-        for move in self.legal_moves():
-            row, col = move
-            # Simulate move
-            self.board[row][col] = player
-            # Minimax with alpha-beta
-            score = self._minimax(False, player, float('-inf'), float('inf'))
-            # Undo move
-            self.board[row][col] = self.EMPTY
+        # Likeliest best move first (ORDERED_BITS), so every later move
+        # only has to be compared against a good score
+        for bit in ORDERED_BITS:
+            if not free & bit:
+                continue
+            # A move earlier in row-major order than best_bit wins a tie
+            # (deterministic tie-breaking), so it only has to reach
+            # best_score; a later one has to beat it. Scores above alpha
+            # are exact.
+            if best_bit is None:
+                alpha = NEG_INF
+            elif bit < best_bit:
+                alpha = best_score - 1
+            else:
+                alpha = best_score
+            if WIN_LOOKUP[ai_bits | bit]:
+                score = 1  # Completes a line
+            elif njit is not None:
+                score = _minimax_kernel(ai_bits | bit, opp_bits, False,
+                                        alpha, POS_INF)
+            else:
+                # Simulate move
+                self._place(bit, side)
+                # Minimax with alpha-beta
+                score = self._minimax(False, side, alpha, POS_INF)
+                # Undo move
+                self._place(bit, side)
             
-            # Update best move (first encountered due to row-major order)
-            if score > best_score:
+            if score > alpha:
                 best_score = score
-                best_move_coords = move
+                best_bit = bit
         
-        return best_move_coords
+        if best_bit is None:
+            return None
+        return divmod(best_bit.bit_length() - 1, 3)
     
-    def _minimax(self, is_maximizing: bool, ai_player: str, 
-                 alpha: float, beta: float) -> float:
+    def _minimax(self, is_maximizing: bool, ai_side: int, 
+                 alpha: int, beta: int) -> int:
         """
         Minimax algorithm with alpha-beta pruning.
         
+        Only called on positions without a winner: each move is checked
+        for completing a line before recursing, so a node never rescans
+        the board for wins.
+        
         Args:
             is_maximizing: True if maximizing player's turn
-            ai_player: The AI player (X or O)
+            ai_side: The AI player (SIDE_X or SIDE_O)
             alpha: Best score maximizer can guarantee
             beta: Best score minimizer can guarantee
         
         Returns:
             Best score for current player
         """
-        # Terminal state evaluation
-        winner = self.winner()
-        if winner == ai_player:
-            return 1  # AI wins
-        elif winner is not None:
-            return -1  # AI loses
-        elif len(self.legal_moves()) == 0:
+        # Terminal state evaluation: wins were caught by the caller, so
+        # only a full board is left
+        x_bits, o_bits = self.x_bits, self.o_bits
+        free = ~(x_bits | o_bits) & FULL_BOARD
+        if not free:
             return 0  # Tie
         
-        opponent = self.O if ai_player == self.X else self.X
+        # Transposition table: an exact score answers outright, a bound
+        # narrows the window and may close it. Keyed on the canonical
+        # board, so all 8 symmetric copies share an entry.
+        tt = self.tt
+        tt_key = (canonical(x_bits, o_bits), ai_side, is_maximizing)
+        entry = tt.get(tt_key)
+        alpha_orig, beta_orig = alpha, beta
+        if entry is not None:
+            tt_score, flag = entry
+            if flag == EXACT:
+                return tt_score
+            elif flag == LOWER:
+                alpha = max(alpha, tt_score)
+            else:
+                beta = min(beta, tt_score)
+            if beta <= alpha:
+                return tt_score
+        
+        opp_side = ai_side ^ 1
+        # Bound once per call rather than looked up on self for every move
+        place = self._place
+        minimax = self._minimax
+        
+        if ai_side == SIDE_X:
+            ai_bits, opp_bits = x_bits, o_bits
+        else:
+            ai_bits, opp_bits = o_bits, x_bits
         
         if is_maximizing:
             # AI's turn: maximize score
-            max_score = float('-inf')
-            for row, col in self.legal_moves():
-                self.board[row][col] = ai_player
-                score = self._minimax(False, ai_player, alpha, beta)
-                self.board[row][col] = self.EMPTY
-                max_score = max(max_score, score)
+            best = NEG_INF
+            for bit in ORDERED_BITS:
+                if not free & bit:
+                    continue
+                if WIN_LOOKUP[ai_bits | bit]:
+                    score = 1  # AI wins
+                else:
+                    place(bit, ai_side)
+                    score = minimax(False, ai_side, alpha, beta)
+                    place(bit, ai_side)  # undo
+                best = max(best, score)
                 alpha = max(alpha, score)
                 if beta <= alpha:
                     break  # Beta cutoff: opponent won't allow this path
-            return max_score
         else:
             # Opponent's turn: minimize score
-            min_score = float('inf')
-            for row, col in self.legal_moves():
-                self.board[row][col] = opponent
-                score = self._minimax(True, ai_player, alpha, beta)
-                self.board[row][col] = self.EMPTY
-                min_score = min(min_score, score)
+            best = POS_INF
+            for bit in ORDERED_BITS:
+                if not free & bit:
+                    continue
+                if WIN_LOOKUP[opp_bits | bit]:
+                    score = -1  # AI loses
+                else:
+                    place(bit, opp_side)
+                    score = minimax(True, ai_side, alpha, beta)
+                    place(bit, opp_side)  # undo
+                best = min(best, score)
                 beta = min(beta, score)
                 if beta <= alpha:
                     break  # Alpha cutoff: AI won't allow this path
-            return min_score
+        
+        # A score outside the (original) window is only a bound
+        if best <= alpha_orig:
+            flag = UPPER
+        elif best >= beta_orig:
+            flag = LOWER
+        else:
+            flag = EXACT
+        tt[tt_key] = (best, flag)
+        return best
+
+
+def _minimax_kernel(ai_bits: int, opp_bits: int, is_maximizing: bool,
+                    alpha: int, beta: int) -> int:
+    """
+    Engine._minimax on plain bitboards, without the transposition table,
+    for numba to compile. Same scores and move order.
+    Only compiled (and used) when numba is installed.
+    """
+    for mask in WIN_MASKS:
+        if ai_bits & mask == mask:
+            return 1  # AI wins
+        if opp_bits & mask == mask:
+            return -1  # AI loses
+    free = ~(ai_bits | opp_bits) & FULL_BOARD
+    if free == 0:
+        return 0  # Tie
+    
+    if is_maximizing:
+        best = NEG_INF
+        for bit in ORDERED_BITS:
+            if free & bit == 0:
+                continue
+            score = _minimax_kernel(ai_bits | bit, opp_bits, False, alpha, beta)
+            best = max(best, score)
+            alpha = max(alpha, score)
+            if beta <= alpha:
+                break
+    else:
+        best = POS_INF
+        for bit in ORDERED_BITS:
+            if free & bit == 0:
+                continue
+            score = _minimax_kernel(ai_bits, opp_bits | bit, True, alpha, beta)
+            best = min(best, score)
+            beta = min(beta, score)
+            if beta <= alpha:
+                break
+    return best
+
+
+if njit is not None:
+    # Not cache=True: numba's on-disk cache of a recursive function crashes
+    # when a later run loads it back. Without a signature numba compiles on
+    # the first call, i.e. the first search off BEST_MOVE, which play
+    # never reaches, so startup doesn't pay for it.
+    _minimax_kernel = njit(_minimax_kernel)
+
+
+def _build_best_move_table() -> dict:
+    """
+    Solve every position reachable from the empty board (X first), for
+    either player to move: (state_key, player) -> best (row, col).
+    Same answer as Engine._search_best_move: the first move in row-major
+    order with the best exact score.
+    """
+    scores = {}  # (mine, theirs) -> score for the player to move, who owns mine
+    
+    def score(mine: int, theirs: int) -> int:
+        key = (mine, theirs)
+        if key not in scores:
+            free = ~(mine | theirs) & FULL_BOARD
+            if WIN_LOOKUP[theirs]:
+                scores[key] = -1  # The last move won
+            elif WIN_LOOKUP[mine]:
+                scores[key] = 1
+            elif not free:
+                scores[key] = 0  # Tie
+            else:
+                scores[key] = max(-score(theirs, mine | 1 << i)
+                                  for i in range(9) if free >> i & 1)
+        return scores[key]
+    
+    table = {}
+    
+    def visit(x_bits: int, o_bits: int, x_to_move: bool) -> None:
+        state = x_bits | o_bits << 9
+        if (state, Engine.X) in table or WIN_LOOKUP[x_bits] or WIN_LOOKUP[o_bits]:
+            return
+        free = ~(x_bits | o_bits) & FULL_BOARD
+        if not free:
+            return
+        for player, mine, theirs in ((Engine.X, x_bits, o_bits), (Engine.O, o_bits, x_bits)):
+            best_score = -2
+            for i in range(9):
+                if free >> i & 1:
+                    child = -score(theirs, mine | 1 << i)
+                    if child > best_score:
+                        best_score = child
+                        table[(state, player)] = divmod(i, 3)
+        # Continue with the player whose turn it actually is
+        for i in range(9):
+            if free >> i & 1:
+                if x_to_move:
+                    visit(x_bits | 1 << i, o_bits, False)
+                else:
+                    visit(x_bits, o_bits | 1 << i, True)
+    
+    visit(0, 0, True)
+    return table
+
+
+# (Engine.state_key(), player to move) -> best (row, col)
+BEST_MOVE = _build_best_move_table()
 
 
 class TicTacToeGUI:
@@ -198,6 +491,8 @@ class TicTacToeGUI:
         
         # GUI components
         self.buttons: List[List[tk.Button]] = []
+        # Text each button currently shows, so redraws skip unchanged cells
+        self._last_shown: List[List[str]] = [[Engine.EMPTY] * 3 for _ in range(3)]
         self._create_menu()
         self._create_status_bar()
         self._create_board()
@@ -242,9 +537,9 @@ class TicTacToeGUI:
         for r in range(3):
             row_buttons = []
             for c in range(3):
-                btn = tk.Button(board_frame, text=" ", font=("Arial", 24), 
+                btn = tk.Button(board_frame, text=Engine.EMPTY, font=("Arial", 24), 
                                width=5, height=2,
-                               command=lambda row=r, col=c: self._on_click(row, col))
+                               command=partial(self._on_click, r, c))
                 btn.grid(row=r, column=c, padx=2, pady=2)
                 row_buttons.append(btn)
             self.buttons.append(row_buttons)
@@ -282,10 +577,14 @@ class TicTacToeGUI:
             )
     
     def _update_board_display(self) -> None:
-        """Sync button display with engine state"""
+        """Sync button display with engine state (changed cells only)"""
         for r in range(3):
+            shown = self._last_shown[r]
             for c in range(3):
-                self.buttons[r][c].config(text=self.engine.board[r][c])
+                text = self.engine.cell(r, c)
+                if text != shown[c]:
+                    self.buttons[r][c].config(text=text)
+                    shown[c] = text
     
     def _on_click(self, row: int, col: int) -> None:
         """Handle board button click"""
@@ -1,16 +1,99 @@
-import math
-from typing import List, Tuple, Optional, Literal
+import itertools
+from typing import Dict, Iterator, List, Tuple, Optional, Literal
+
+try:
+    from numba import njit  # optional: compiles the search to native code
+except ImportError:
+    njit = None
+
+try:
+    # optional: C build of minimax_kernel, see engine_core.pyx
+    from engine_core import minimax as _compiled_minimax
+except ImportError:
+    _compiled_minimax = None
 
 # --- Constants ---
 PLAYER_X = "X"
 PLAYER_O = "O"
 EMPTY = " "
+TIE = "tie"  # TicTacToeEngine.get_result() for a full board with no winner
 
 # Define type hints for clarity
 Board = List[List[str]]
 Player = Literal["X", "O"]
+Result = Optional[Literal["X", "O", "tie"]]
 Move = Tuple[int, int]
 
+# Every cell, top-left to bottom-right
+ROW_MAJOR_MOVES = tuple((r, c) for r in range(3) for c in range(3))
+
+# Move order used inside minimax: center, corners, then edges. Trying
+# the strongest cells first lets alpha-beta cut off sooner. The root
+# (search_best_move) keeps row-major order for its tie-breaking.
+ORDERED_MOVES = ((1, 1), (0, 0), (0, 2), (2, 0), (2, 2),
+                 (0, 1), (1, 0), (1, 2), (2, 1))
+# The same order as bits (row * 3 + col), for minimax_kernel
+ORDERED_BITS = tuple(1 << (r * 3 + c) for r, c in ORDERED_MOVES)
+
+# Winning lines as 9-bit masks, with cell (row, col) at bit (row * 3 + col).
+# WIN_LOOKUP[bits] is True if those cells contain a complete line, so
+# checking a player for a win is a single table lookup.
+WIN_MASKS = (0b000000111, 0b000111000, 0b111000000,  # rows
+             0b001001001, 0b010010010, 0b100100100,  # columns
+             0b100010001, 0b001010100)               # diagonals
+WIN_LOOKUP = tuple(any((bits & m) == m for m in WIN_MASKS) for bits in range(512))
+
+def _board_bits_table() -> Dict[Tuple[str, ...], Tuple[int, int]]:
+    """(x_bits, o_bits) for each of the 3^9 flattened boards."""
+    rows = {}
+    for cells in itertools.product((EMPTY, PLAYER_X, PLAYER_O), repeat=3):
+        rows[cells] = (sum(1 << i for i, cell in enumerate(cells) if cell == PLAYER_X),
+                       sum(1 << i for i, cell in enumerate(cells) if cell == PLAYER_O))
+    return {top + mid + bot: (x0 | x1 << 3 | x2 << 6, o0 | o1 << 3 | o2 << 6)
+            for top, (x0, o0) in rows.items()
+            for mid, (x1, o1) in rows.items()
+            for bot, (x2, o2) in rows.items()}
+
+# BOARD_BITS[flat board] -> (x_bits, o_bits), where the flat board is the
+# tuple of all 9 cells, row by row. board_bits flattens the board once and
+# does one lookup instead of testing each cell.
+BOARD_BITS = _board_bits_table()
+
+# The reverse: BOARD_CHARS[(x_bits, o_bits)] is the 9-character string
+# of cells, row by row (see board_chars)
+BOARD_CHARS = {bits: "".join(cells) for cells, bits in BOARD_BITS.items()}
+
+# The 8 symmetries of the board (4 rotations, each optionally mirrored)
+# as cell permutations: SYMMETRIES[s][i] is where cell i goes.
+def _symmetries() -> List[Tuple[int, ...]]:
+    rot90 = tuple(c * 3 + 2 - r for r in range(3) for c in range(3))   # (r, c) -> (c, 2 - r)
+    mirror = tuple(r * 3 + 2 - c for r in range(3) for c in range(3))  # (r, c) -> (r, 2 - c)
+    perms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append(tuple(mirror[i] for i in perm))
+        perm = tuple(rot90[i] for i in perm)
+    return perms
+
+SYMMETRIES = _symmetries()
+
+# PERM_BITS[s][bits]: the bitboard bits moved by SYMMETRIES[s], in one lookup
+PERM_BITS = tuple(tuple(sum(1 << perm[i] for i in range(9) if bits >> i & 1)
+                        for bits in range(512))
+                  for perm in SYMMETRIES)
+
+# Alpha-beta bounds. Scores are only -1, 0 or +1, so -2/+2 work as
+# infinities and keep every comparison between small ints.
+NEG_INF = -2
+POS_INF = 2
+
+# Transposition table for minimax, shared by all searches:
+# (canonical key, is_maximizing, ai_player) -> (value, flag), where the
+# flag says whether value is exact or only a lower/upper bound
+EXACT, LOWER, UPPER = 0, 1, 2
+TRANSPOSITION_TABLE: Dict[Tuple[int, bool, str], Tuple[int, int]] = {}
+
 # --- Public AI Function ---
 
 def find_best_move(board: Board, player: Player) -> Move:
@@ -18,6 +101,12 @@ def find_best_move(board: Board, player: Player) -> Move:
     Finds the best possible move for the given player using
     Minimax with Alpha-Beta Pruning.
 
+    Positions reachable in play are solved once, on the first call
+    (BEST_MOVE), so this is normally a single lookup; any other board
+    is searched.
+    That includes the empty board ((0, 0) for X) and the one-mark
+    openings, so no separate opening book is needed.
+
     Args:
         board: The current 3x3 game board.
         player: The player whose turn it is ("X" or "O").
@@ -25,30 +114,71 @@ def find_best_move(board: Board, player: Player) -> Move:
     Returns:
         A tuple (row, col) for the best move.
     """
-    best_val = -math.inf
+    x_bits, o_bits = board_bits(board)
+    return find_best_move_bits(x_bits, o_bits, player)
+
+def find_best_move_bits(x_bits: int, o_bits: int, player: Player) -> Move:
+    """find_best_move for a board given as bitboards (see board_bits)."""
+    if not BEST_MOVE:
+        BEST_MOVE.update(_build_best_move_table())
+    move = BEST_MOVE.get((x_bits | o_bits << 9, player))
+    if move is not None:
+        return move
+    return search_best_move(bits_board(x_bits, o_bits), player)
+
+def search_best_move(board: Board, player: Player) -> Move:
+    """
+    find_best_move by a full Minimax search, without BEST_MOVE.
+
+    Moves are tried on board itself and undone, so board is back
+    as it was when this returns.
+    """
+    best_val = NEG_INF
     best_move = (-1, -1)
+    x_bits, o_bits = board_bits(board)
+    ai_bits, opp_bits = (x_bits, o_bits) if player == PLAYER_X else (o_bits, x_bits)
     
-    # Iterate through all legal moves.
-    # This loop provides the deterministic tie-breaking.
-    # The first move found with the highest value is chosen.
-    for r, c in get_legal_moves(board):
-        # Make the move on a copy of the board
-        new_board = [row[:] for row in board]
-        new_board[r][c] = player
-        
-        # Call minimax for the *opponent* (minimizing player)
-        # The opponent will try to minimize our score.
-        move_val = minimax(
-            board=new_board,
-            depth=0,
-            alpha=-math.inf,
-            beta=math.inf,
-            is_maximizing=False, # It's opponent's turn
-            ai_player=player      # The "ai_player" is who we score for
-        )
+    # Iterate through all legal moves, likeliest best first
+    # (ORDERED_MOVES), so later moves are tested against a good value.
+    # Deterministic tie-breaking: of the moves with the highest value,
+    # the first one top-left to bottom-right is chosen. So a move before
+    # best_move only has to reach best_val, and a move after it has to
+    # beat it; values above alpha are exact.
+    for r, c in get_legal_moves(board, ordered=True):
+        if best_move == (-1, -1):
+            alpha = NEG_INF
+        elif (r, c) < best_move:
+            alpha = best_val - 1
+        else:
+            alpha = best_val
+        if WIN_LOOKUP[ai_bits | 1 << (r * 3 + c)]:
+            move_val = 1 # Completes a line: nothing to search
+        elif _compiled_minimax is not None:
+            # C build of minimax_kernel, opponent to move
+            move_val = _compiled_minimax(ai_bits | 1 << (r * 3 + c), opp_bits,
+                                         False, alpha, POS_INF)
+        elif njit is not None:
+            # Compiled search over bitboards, opponent to move
+            move_val = minimax_kernel(ai_bits | 1 << (r * 3 + c), opp_bits,
+                                      False, alpha, POS_INF)
+        else:
+            # Make the move in place (undone below)
+            board[r][c] = player
+            
+            # Call minimax for the *opponent* (minimizing player)
+            # The opponent will try to minimize our score.
+            move_val = minimax(
+                board=board,
+                depth=0,
+                alpha=alpha,
+                beta=POS_INF,
+                is_maximizing=False, # It's opponent's turn
+                ai_player=player      # The "ai_player" is who we score for
+            )
+            board[r][c] = EMPTY
         
-        # Update best move if this move is better
-        if move_val > best_val:
+        # Update best move if this move is better (or ties and comes first)
+        if move_val > alpha:
             best_val = move_val
             best_move = (r, c)
             
@@ -56,11 +186,14 @@ def find_best_move(board: Board, player: Player) -> Move:
 
 # --- Minimax Implementation ---
 
-def minimax(board: Board, depth: int, alpha: float, beta: float, 
+def minimax(board: Board, depth: int, alpha: int, beta: int, 
             is_maximizing: bool, ai_player: Player) -> int:
     """
     Recursive Minimax function with Alpha-Beta Pruning.
 
+    Each move is made on board in place and undone after the recursive
+    call, so board is unchanged when this returns.
+
     Args:
         board: The current board state to evaluate.
         depth: The current depth in the search tree.
@@ -74,51 +207,77 @@ def minimax(board: Board, depth: int, alpha: float, beta: float,
     """
     
     # --- Base Case: Check for terminal state ---
-    winner = check_winner(board)
-    if winner:
+    # (terminal_state, keeping the bits for the table key below)
+    x_bits, o_bits = board_bits(board)
+    if WIN_LOOKUP[x_bits]:
         # Return +1 if the AI we're solving for wins
         # Return -1 if the opponent wins
-        return 1 if winner == ai_player else -1
+        return 1 if ai_player == PLAYER_X else -1
+    if WIN_LOOKUP[o_bits]:
+        return 1 if ai_player == PLAYER_O else -1
     
-    if is_board_full(board):
+    if (x_bits | o_bits) == 0x1FF:
         # It's a tie
         return 0
 
+    # --- Transposition Table ---
+    # An exact value answers outright; a bound narrows the window
+    # and may close it. Symmetric boards have the same value, so they
+    # share one entry under their canonical key.
+    tt_key = (canonical(x_bits, o_bits), is_maximizing, ai_player)
+    entry = TRANSPOSITION_TABLE.get(tt_key)
+    alpha_orig, beta_orig = alpha, beta
+    if entry is not None:
+        tt_val, flag = entry
+        if flag == EXACT:
+            return tt_val
+        elif flag == LOWER:
+            alpha = max(alpha, tt_val)
+        else:
+            beta = min(beta, tt_val)
+        if beta <= alpha:
+            return tt_val
+
     # --- Recursive Step ---
+    # A move that completes a line is scored here, without recursing,
+    # so below the root the base case never finds a winner.
+    ai_bits, opp_bits = (x_bits, o_bits) if ai_player == PLAYER_X else (o_bits, x_bits)
     
     if is_maximizing:
         # MAXIMIZER'S TURN (Our AI)
-        best_val = -math.inf
+        best_val = NEG_INF
         opponent = PLAYER_O if ai_player == PLAYER_X else PLAYER_X
         
-        for r, c in get_legal_moves(board):
-            # Make the move on a copy
-            new_board = [row[:] for row in board]
-            new_board[r][c] = ai_player # Maximizer places *its* mark
-            
-            # Recurse for the *minimizer*
-            val = minimax(new_board, depth + 1, alpha, beta, False, ai_player)
+        for r, c in get_legal_moves(board, ordered=True):
+            if WIN_LOOKUP[ai_bits | 1 << (r * 3 + c)]:
+                val = 1 # AI wins with this move
+            else:
+                board[r][c] = ai_player # Maximizer places *its* mark
+                
+                # Recurse for the *minimizer*, then undo the move
+                val = minimax(board, depth + 1, alpha, beta, False, ai_player)
+                board[r][c] = EMPTY
             best_val = max(best_val, val)
             alpha = max(alpha, best_val)
             
             # Alpha-Beta Pruning
             if beta <= alpha:
                 break # Beta cut-off
-                
-        return best_val
         
     else:
         # MINIMIZER'S TURN (Opponent)
-        best_val = math.inf
+        best_val = POS_INF
         opponent = PLAYER_O if ai_player == PLAYER_X else PLAYER_X
 
-        for r, c in get_legal_moves(board):
-            # Make the move on a copy
-            new_board = [row[:] for row in board]
-            new_board[r][c] = opponent # Minimizer places *its* mark
-            
-            # Recurse for the *maximizer*
-            val = minimax(new_board, depth + 1, alpha, beta, True, ai_player)
+        for r, c in get_legal_moves(board, ordered=True):
+            if WIN_LOOKUP[opp_bits | 1 << (r * 3 + c)]:
+                val = -1 # Opponent wins with this move
+            else:
+                board[r][c] = opponent # Minimizer places *its* mark
+                
+                # Recurse for the *maximizer*, then undo the move
+                val = minimax(board, depth + 1, alpha, beta, True, ai_player)
+                board[r][c] = EMPTY
             best_val = min(best_val, val)
             beta = min(beta, best_val)
             
@@ -126,7 +285,72 @@ def minimax(board: Board, depth: int, alpha: float, beta: float,
             if beta <= alpha:
                 break # Alpha cut-off
 
-        return best_val
+    # Store the result; outside the original window it is only a bound
+    if best_val <= alpha_orig:
+        flag = UPPER
+    elif best_val >= beta_orig:
+        flag = LOWER
+    else:
+        flag = EXACT
+    TRANSPOSITION_TABLE[tt_key] = (best_val, flag)
+    return best_val
+
+def minimax_kernel(ai_bits: int, opp_bits: int, is_maximizing: bool,
+                   alpha: int, beta: int) -> int:
+    """
+    minimax on bitboards (see board_bits), for numba to compile.
+
+    Same values and move order as minimax, without the transposition
+    table. Only compiled, and only used by search_best_move, when numba
+    is installed and engine_core isn't built.
+
+    Args:
+        ai_bits: The cells held by the player we score for.
+        opp_bits: The cells held by the opponent.
+        is_maximizing: True if it's the AI's turn to move.
+        alpha: The best value found so far for the maximizer.
+        beta: The best value found so far for the minimizer.
+
+    Returns:
+        1, 0, or -1, as minimax.
+    """
+    for mask in WIN_MASKS:
+        if ai_bits & mask == mask:
+            return 1
+        if opp_bits & mask == mask:
+            return -1
+    free = ~(ai_bits | opp_bits) & 0x1FF
+    if free == 0:
+        return 0
+
+    if is_maximizing:
+        best_val = NEG_INF
+        for bit in ORDERED_BITS:
+            if free & bit == 0:
+                continue
+            val = minimax_kernel(ai_bits | bit, opp_bits, False, alpha, beta)
+            best_val = max(best_val, val)
+            alpha = max(alpha, best_val)
+            if beta <= alpha:
+                break # Beta cut-off
+    else:
+        best_val = POS_INF
+        for bit in ORDERED_BITS:
+            if free & bit == 0:
+                continue
+            val = minimax_kernel(ai_bits, opp_bits | bit, True, alpha, beta)
+            best_val = min(best_val, val)
+            beta = min(beta, best_val)
+            if beta <= alpha:
+                break # Alpha cut-off
+    return best_val
+
+if njit is not None and _compiled_minimax is None:
+    # Not cache=True: numba's on-disk cache of a recursive function
+    # crashes when a later run loads it back. Without a signature numba
+    # compiles on the first call, i.e. the first search outside
+    # BEST_MOVE, which play never reaches, so startup doesn't pay for it.
+    minimax_kernel = njit(minimax_kernel)
 
 # --- Game Rules and State Helpers ---
 
@@ -134,51 +358,152 @@ def get_initial_board() -> Board:
     """Returns a new, empty 3x3 board."""
     return [[EMPTY for _ in range(3)] for _ in range(3)]
 
-def get_legal_moves(board: Board) -> List[Move]:
-    """Returns a list of (row, col) tuples for all empty cells."""
-    moves = []
-    for r in range(3):
-        for c in range(3):
-            if board[r][c] == EMPTY:
-                moves.append((r, c))
-    return moves
+def get_legal_moves(board: Board, ordered: bool = False) -> Iterator[Move]:
+    """
+    Yields (row, col) for every empty cell, top-left to bottom-right,
+    or in ORDERED_MOVES order if ordered.
+    """
+    for move in ORDERED_MOVES if ordered else ROW_MAJOR_MOVES:
+        if board[move[0]][move[1]] == EMPTY:
+            yield move
+
+def has_legal_move(board: Board) -> bool:
+    """Returns True if at least one cell is EMPTY."""
+    for row in board:
+        if EMPTY in row:
+            return True
+    return False
+
+def board_key(board: Board) -> int:
+    """Packs the board into one int: x_bits | o_bits << 9 (see board_bits)."""
+    x_bits, o_bits = board_bits(board)
+    return x_bits | o_bits << 9
+
+def canonical(x_bits: int, o_bits: int) -> int:
+    """
+    Canonical key of a position: the smallest x_bits | o_bits << 9
+    over its 8 symmetric copies (see PERM_BITS).
+    """
+    best = 1 << 18
+    for perm_bits in PERM_BITS:
+        key = perm_bits[x_bits] | perm_bits[o_bits] << 9
+        if key < best:
+            best = key
+    return best
+
+def board_bits(board: Board) -> Tuple[int, int]:
+    """Returns (x_bits, o_bits): bit (row * 3 + col) set for each mark."""
+    top, mid, bot = board
+    return BOARD_BITS[(*top, *mid, *bot)]
+
+def board_chars(x_bits: int, o_bits: int) -> str:
+    """The 9 cells of a bitboard position as a string, row by row."""
+    return BOARD_CHARS[(x_bits, o_bits)]
+
+def bits_board(x_bits: int, o_bits: int) -> Board:
+    """Returns a new 3x3 Board holding the bitboard position."""
+    cells = BOARD_CHARS[(x_bits, o_bits)]
+    return [list(cells[0:3]), list(cells[3:6]), list(cells[6:9])]
 
 def check_winner(board: Board) -> Optional[Player]:
     """
-    Checks for a win condition.
+    Checks for a win condition (rows, columns, diagonals).
 
     Returns:
         "X", "O", or None if no winner.
     """
-    # Check rows
-    for r in range(3):
-        if board[r][0] == board[r][1] == board[r][2] != EMPTY:
-            return board[r][0]
-            
-    # Check columns
-    for c in range(3):
-        if board[c][0] == board[c][1] == board[c][2] != EMPTY:
-            return board[c][0]
-            
-    # Check diagonals
-    if board[0][0] == board[1][1] == board[2][2] != EMPTY:
-        return board[0][0]
-    if board[0][2] == board[1][1] == board[2][0] != EMPTY:
-        return board[0][2]
-        
+    x_bits, o_bits = board_bits(board)
+    if WIN_LOOKUP[x_bits]:
+        return PLAYER_X
+    if WIN_LOOKUP[o_bits]:
+        return PLAYER_O
     return None
 
+def terminal_state(board: Board) -> Tuple[Optional[Player], bool]:
+    """
+    Checks for a winner and a full board in a single pass.
+
+    Returns:
+        (winner, full): "X", "O" or None, and True if no EMPTY cells are left.
+    """
+    x_bits, o_bits = board_bits(board)
+    if WIN_LOOKUP[x_bits]:
+        winner = PLAYER_X
+    elif WIN_LOOKUP[o_bits]:
+        winner = PLAYER_O
+    else:
+        winner = None
+    return winner, (x_bits | o_bits) == 0x1FF
+
 def is_board_full(board: Board) -> bool:
     """Returns True if no EMPTY cells are left."""
-    for r in range(3):
-        for c in range(3):
-            if board[r][c] == EMPTY:
-                return False
-    return True
+    return not has_legal_move(board)
 
 def is_terminal(board: Board) -> bool:
     """Returns True if the game is over (win or tie)."""
-    return check_winner(board) is not None or is_board_full(board)
+    winner, full = terminal_state(board)
+    return winner is not None or full
+
+# --- Precomputed Best Moves ---
+
+def _build_best_move_table() -> Dict[Tuple[int, Player], Move]:
+    """
+    Solves every position reachable from the empty board (X first),
+    for either player to move. Works on bitboards (see board_bits)
+    rather than on a Board.
+
+    Returns:
+        A dict (board_key, player) -> (row, col): the first legal move,
+        top-left to bottom-right, with the best exact Minimax value,
+        which is the move search_best_move returns.
+    """
+    values = {}  # (mine, theirs) -> value for the player to move, who owns mine
+
+    def value(mine: int, theirs: int) -> int:
+        key = (mine, theirs)
+        if key not in values:
+            free = ~(mine | theirs) & 0x1FF
+            if WIN_LOOKUP[theirs]:
+                result = -1 # The last move won
+            elif not free:
+                result = 0
+            else:
+                result = max(-value(theirs, mine | 1 << i)
+                             for i in range(9) if free >> i & 1)
+            values[key] = result
+        return values[key]
+
+    table = {}
+
+    def visit(x_bits: int, o_bits: int, x_to_move: bool) -> None:
+        key = x_bits | o_bits << 9
+        if (key, PLAYER_X) in table or WIN_LOOKUP[x_bits] or WIN_LOOKUP[o_bits]:
+            return
+        free = ~(x_bits | o_bits) & 0x1FF
+        if not free:
+            return
+        for player, mine, theirs in ((PLAYER_X, x_bits, o_bits), (PLAYER_O, o_bits, x_bits)):
+            best_val = -2
+            for i in range(9): # top-left to bottom-right
+                if free >> i & 1:
+                    move_val = -value(theirs, mine | 1 << i)
+                    if move_val > best_val:
+                        best_val = move_val
+                        table[(key, player)] = divmod(i, 3)
+        # Walk on with the player whose turn it really is
+        for i in range(9):
+            if free >> i & 1:
+                if x_to_move:
+                    visit(x_bits | 1 << i, o_bits, False)
+                else:
+                    visit(x_bits, o_bits | 1 << i, True)
+
+    visit(0, 0, True)
+    return table
+
+# (board_key(board), player) -> best (row, col). Empty until the first
+# find_best_move call fills it.
+BEST_MOVE: Dict[Tuple[int, Player], Move] = {}
 
 # --- Engine Class (State Manager) ---
 
@@ -186,15 +511,29 @@ class TicTacToeEngine:
     """
     Manages the state of a single Tic-Tac-Toe game.
     This is used by the GUI to keep track of the current game.
+
+    The position is kept as two bitboards, x_mask and o_mask, with
+    bit (row * 3 + col) set for each mark (as board_bits).
     """
     def __init__(self):
-        self.board = get_initial_board()
+        self.x_mask = 0
+        self.o_mask = 0
         self.current_player: Player = PLAYER_X
+        # get_result() for the current board, worked out on first use
+        # after each change (see _result_stale)
+        self._result_cache: Result = None
+        self._result_stale = True
+
+    @property
+    def board(self) -> Board:
+        """The position as a new 3x3 Board. Changing it doesn't change the game."""
+        return bits_board(self.x_mask, self.o_mask)
 
     def reset_game(self):
         """Resets the board and current player."""
-        self.board = get_initial_board()
+        self.x_mask = self.o_mask = 0
         self.current_player = PLAYER_X
+        self._result_stale = True
 
     def make_move(self, row: int, col: int) -> bool:
         """
@@ -208,24 +547,48 @@ class TicTacToeEngine:
             True if the move was successful, False if illegal
             (cell occupied or game over).
         """
-        if self.board[row][col] == EMPTY and not self.is_game_over():
-            self.board[row][col] = self.current_player
-            self.toggle_player()
-            return True
-        return False
+        bit = 1 << (row * 3 + col)
+        if (self.x_mask | self.o_mask) & bit or self.get_result() is not None:
+            return False
+        if self.current_player == PLAYER_X:
+            self.x_mask |= bit
+        else:
+            self.o_mask |= bit
+        self.toggle_player()
+        self._result_stale = True
+        return True
 
     def toggle_player(self):
         """Switches the current player from X to O or O to X."""
         self.current_player = PLAYER_O if self.current_player == PLAYER_X else PLAYER_X
 
+    def get_result(self) -> Result:
+        """
+        Returns "X" or "O" if that player has won, TIE if the board is
+        full with no winner, or None while the game is still going.
+        Only rechecks the board after make_move or reset_game.
+        """
+        if self._result_stale:
+            if WIN_LOOKUP[self.x_mask]:
+                self._result_cache = PLAYER_X
+            elif WIN_LOOKUP[self.o_mask]:
+                self._result_cache = PLAYER_O
+            elif (self.x_mask | self.o_mask) == 0x1FF:
+                self._result_cache = TIE
+            else:
+                self._result_cache = None
+            self._result_stale = False
+        return self._result_cache
+
     def get_winner(self) -> Optional[Player]:
         """Checks for a winner."""
-        return check_winner(self.board)
+        result = self.get_result()
+        return None if result == TIE else result
 
     def is_tie(self) -> bool:
         """Checks for a tie (board full, no winner)."""
-        return is_board_full(self.board) and not self.get_winner()
+        return self.get_result() == TIE
 
     def is_game_over(self) -> bool:
         """Checks if the game is in a terminal state."""
-        return self.get_winner() is not None or is_board_full(self.board)
\ No newline at end of file
+        return self.get_result() is not None
@@ -0,0 +1,82 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# distutils: extra_compile_args = -O3
+"""
+Optional C build of engine.minimax_kernel.
+
+engine.py uses this module when it has been built and falls back to
+numba, then to the pure Python minimax, otherwise. Building it is
+never required.
+
+Build (needs Cython and a C compiler), in this directory:
+    cythonize -i engine_core.pyx
+
+Same bitboards (bit row * 3 + col), values (+1 / 0 / -1 for the AI)
+and move order as engine.py. The recursion runs on C ints without
+the GIL.
+"""
+
+cdef int FULL_BOARD = 0x1FF
+cdef int NEG_INF = -2
+cdef int POS_INF = 2
+
+# Rows, columns, diagonals (engine.WIN_MASKS)
+cdef int[8] WIN_MASKS = [0b000000111, 0b000111000, 0b111000000,
+                         0b001001001, 0b010010010, 0b100100100,
+                         0b100010001, 0b001010100]
+
+# Center, corners, then edges (engine.ORDERED_BITS)
+cdef int[9] ORDERED_BITS = [1 << 4, 1 << 0, 1 << 2, 1 << 6, 1 << 8,
+                            1 << 1, 1 << 3, 1 << 5, 1 << 7]
+
+
+cdef int _search(int ai_bits, int opp_bits, bint is_maximizing,
+                 int alpha, int beta) noexcept nogil:
+    cdef int i, mask, bit, val, best_val
+    for i in range(8):
+        mask = WIN_MASKS[i]
+        if ai_bits & mask == mask:
+            return 1
+        if opp_bits & mask == mask:
+            return -1
+    cdef int free = ~(ai_bits | opp_bits) & FULL_BOARD
+    if free == 0:
+        return 0
+
+    if is_maximizing:
+        best_val = NEG_INF
+        for i in range(9):
+            bit = ORDERED_BITS[i]
+            if free & bit == 0:
+                continue
+            val = _search(ai_bits | bit, opp_bits, False, alpha, beta)
+            if val > best_val:
+                best_val = val
+            if best_val > alpha:
+                alpha = best_val
+            if beta <= alpha:
+                break  # Beta cut-off
+    else:
+        best_val = POS_INF
+        for i in range(9):
+            bit = ORDERED_BITS[i]
+            if free & bit == 0:
+                continue
+            val = _search(ai_bits, opp_bits | bit, True, alpha, beta)
+            if val < best_val:
+                best_val = val
+            if best_val < beta:
+                beta = best_val
+            if beta <= alpha:
+                break  # Alpha cut-off
+    return best_val
+
+
+def minimax(int ai_bits, int opp_bits, bint is_maximizing, int alpha, int beta):
+    """
+    Drop-in replacement for engine.minimax_kernel, same arguments
+    and values.
+    """
+    cdef int value
+    with nogil:
+        value = _search(ai_bits, opp_bits, is_maximizing, alpha, beta)
+    return value
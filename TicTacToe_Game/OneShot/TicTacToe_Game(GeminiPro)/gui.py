@@ -1,3 +1,6 @@
+import time
+from contextlib import contextmanager
+from functools import partial
 import tkinter as tk
 from tkinter import Frame, Button, Label, Menu, StringVar, Toplevel
 from tkinter.constants import SUNKEN, W, E, NORMAL, DISABLED
@@ -10,6 +13,11 @@ import engine
 PLAYER_X = engine.PLAYER_X
 PLAYER_O = engine.PLAYER_O
 EMPTY = engine.EMPTY
+TIE = engine.TIE
+
+# Least time an AI reply takes to show up in Human vs AI, so it doesn't
+# land on the same frame as the human's move. AI vs AI runs undelayed.
+AI_MIN_DELAY_MS = 100
 
 class TicTacToeGUI:
     """
@@ -29,6 +37,18 @@ class TicTacToeGUI:
         self.mode_var = StringVar(value="Human vs Human")
         self.human_player_var = StringVar(value=PLAYER_X)
         self.human_player_var.trace_add("write", self._on_player_change)
+        # Plain copies of the two variables above, kept in step by
+        # their menu handlers, so game flow doesn't read back through Tcl
+        self._mode = self.mode_var.get()
+        self._human_player = self.human_player_var.get()
+        # Pending root.after job for the AI's move, cancelled by new_game
+        self._ai_job: Optional[str] = None
+        # Open _batch() blocks, and the parts of the window they have
+        # marked for redrawing ("board", "buttons", "score", "status"),
+        # plus "ai" when the AI's move is to be queued after the redraw
+        self._batch_depth = 0
+        self._pending: set = set()
+        self._buttons_state = NORMAL
         
         # --- Build UI Components ---
         self._create_menu()
@@ -106,12 +126,25 @@ class TicTacToeGUI:
         self.score_label_ties.pack(side=tk.LEFT)
         self.score_label_o.pack(side=tk.LEFT)
 
+        # Label and shown text for each score, so redraws only touch
+        # the labels whose score changed
+        self._score_labels = {"X": self.score_label_x, "O": self.score_label_o,
+                              "Ties": self.score_label_ties}
+        self._last_score_text = {"X": "X Wins: 0", "O": "O Wins: 0", "Ties": "Ties: 0"}
+
     def _create_board_frame(self):
         """Creates the 3x3 grid of buttons for the game board."""
         board_frame = Frame(self.root)
         board_frame.pack(pady=10, expand=True)
         
         self.board_buttons: List[List[Button]] = []
+        # The same buttons in row-major order (as engine.board_chars),
+        # so updates walk the board in one flat loop
+        self._flat_buttons: List[Button] = []
+        # Text and state each button currently has (same order), so
+        # updates only configure the cells that change
+        self._last_text = [EMPTY] * 9
+        self._last_state = [NORMAL] * 9
         for r in range(3):
             row_list = []
             for c in range(3):
@@ -123,11 +156,16 @@ class TicTacToeGUI:
                     height=2,
                     relief=SUNKEN,
                     bd=1,
-                    command=lambda r=r, c=c: self._on_cell_click(r, c)
+                    command=partial(self._on_cell_click, r, c)
                 )
                 button.grid(row=r, column=c, padx=2, pady=2)
                 row_list.append(button)
+                self._flat_buttons.append(button)
             self.board_buttons.append(row_list)
+        # Redraws configure the buttons with raw Tcl calls on their
+        # widget paths, skipping Button.config's option handling
+        self._tk_call = self.root.tk.call
+        self._button_paths = [button._w for button in self._flat_buttons]
 
     def _create_status_bar(self):
         """Creates the label at the bottom for game status."""
@@ -140,32 +178,47 @@ class TicTacToeGUI:
 
     def new_game(self):
         """Starts a new round of Tic-Tac-Toe."""
-        self.game_engine.reset_game()
-        self._update_board_buttons()
-        self._enable_all_buttons()
-        self._update_player_menu_state()
-        self._update_status_bar()
-        
-        # Check if AI should make the first move
-        self._check_for_ai_turn()
+        with self._batch():
+            self.game_engine.reset_game()
+            self._update_board_buttons()
+            self._restart_turns()
+
+    def _restart_turns(self):
+        """
+        Sets up the first turn of the game on the (empty) board:
+        drops any pending AI move, re-enables the board and lets the
+        AI open if it plays X.
+        """
+        if self._ai_job is not None:
+            # Drop an AI move still pending from the previous game
+            self.root.after_cancel(self._ai_job)
+            self._ai_job = None
+        with self._batch():
+            self._enable_all_buttons()
+            self._update_player_menu_state()
+            self._update_status_bar()
+            
+            # Check if AI should make the first move
+            self._check_for_ai_turn()
 
     def reset_scores(self):
         """Resets all scores to 0."""
         self.scores = {"X": 0, "O": 0, "Ties": 0}
-        self._update_scoreboard()
-        self._update_status_bar()
+        with self._batch():
+            self._update_scoreboard()
+            self._update_status_bar()
 
     def _on_cell_click(self, row: int, col: int):
         """Handles a human player clicking on a board cell."""
         
         # 1. Check if the game is already over
-        if self.game_engine.is_game_over():
+        if self.game_engine.get_result() is not None:
             return
 
         # 2. Determine if it's a human's turn
         is_human_turn = False
-        current_mode = self.mode_var.get()
-        human_player = self.human_player_var.get()
+        current_mode = self._mode
+        human_player = self._human_player
         
         if current_mode == "Human vs Human":
             is_human_turn = True
@@ -180,29 +233,31 @@ class TicTacToeGUI:
         success = self.game_engine.make_move(row, col)
         
         if success:
-            # 4. Update the board
-            self._update_board_buttons()
-            
-            # 5. Check for game end
-            if self._check_for_game_end():
-                return # Game over, stop here
-            
-            # 6. Update status (e.g., "O's turn")
-            self._update_status_bar()
-            
-            # 7. If game is not over, check if it's now an AI's turn
-            self._check_for_ai_turn()
+            # Steps 4-7 redraw the window once, when the block ends
+            with self._batch():
+                # 4. Update the board
+                self._update_board_buttons()
+                
+                # 5. Check for game end
+                if self._check_for_game_end():
+                    return # Game over, stop here
+                
+                # 6. Update status (e.g., "O's turn")
+                self._update_status_bar()
+                
+                # 7. If game is not over, check if it's now an AI's turn
+                self._check_for_ai_turn()
 
     def _check_for_ai_turn(self):
         """
         Checks if the current player is an AI, and if so,
         triggers the AI's move.
         """
-        if self.game_engine.is_game_over():
+        if self.game_engine.get_result() is not None:
             return
             
-        current_mode = self.mode_var.get()
-        human_player = self.human_player_var.get()
+        current_mode = self._mode
+        human_player = self._human_player
         current_player = self.game_engine.current_player
         
         is_ai_turn = False
@@ -215,39 +270,57 @@ class TicTacToeGUI:
             # Disable board during AI 'thinking' (even if instant)
             self._disable_all_buttons()
             
-            # Use root.after to make the AI move non-blocking
-            # This allows the UI to update (e.g., button disable)
-            # before the AI calculation (which is fast, but good practice).
-            self.root.after(100, self._make_ai_move)
+            # The move is queued with root.after_idle once the batch
+            # has been drawn (see _flush_pending), so the UI updates
+            # (e.g., button disable) before the AI calculation, which
+            # runs from the main loop. Any delay for Human vs AI
+            # is added in _make_ai_move, once the move is known.
+            with self._batch():
+                self._pending.add("ai")
 
     def _make_ai_move(self):
-        """Finds and executes the AI's best move."""
-        if self.game_engine.is_game_over():
+        """Finds the AI's best move and schedules it."""
+        self._ai_job = None
+        if self.game_engine.get_result() is not None:
             return
             
-        # Get best move from the engine
-        board_state = self.game_engine.board
-        player = self.game_engine.current_player
-        row, col = engine.find_best_move(board_state, player)
+        # Get best move from the engine, timing the search
+        start = time.perf_counter()
+        game = self.game_engine
+        row, col = engine.find_best_move_bits(game.x_mask, game.o_mask,
+                                              game.current_player)
+        elapsed_ms = (time.perf_counter() - start) * 1000
         
-        # Make the move
-        self.game_engine.make_move(row, col)
-        
-        # Update UI
-        self._update_board_buttons()
+        if self._mode == "AI vs AI":
+            self._apply_ai_move(row, col)
+        else:
+            # Pad only the part of AI_MIN_DELAY_MS the search didn't use
+            delay = max(0, round(AI_MIN_DELAY_MS - elapsed_ms))
+            self._ai_job = self.root.after(delay, self._apply_ai_move, row, col)
+
+    def _apply_ai_move(self, row: int, col: int):
+        """Executes the AI's move and continues the game."""
+        self._ai_job = None
         
-        # Check for game end
-        if self._check_for_game_end():
-            return
+        with self._batch():
+            # Make the move
+            self.game_engine.make_move(row, col)
             
-        # Re-enable board if it's now a human's turn
-        if self.mode_var.get() == "Human vs AI":
-            self._enable_all_buttons()
-        
-        self._update_status_bar()
-        
-        # Check for *another* AI turn (for AI vs AI mode)
-        self._check_for_ai_turn()
+            # Update UI
+            self._update_board_buttons()
+            
+            # Check for game end
+            if self._check_for_game_end():
+                return
+                
+            # Re-enable board if it's now a human's turn
+            if self._mode == "Human vs AI":
+                self._enable_all_buttons()
+            
+            self._update_status_bar()
+            
+            # Check for *another* AI turn (for AI vs AI mode)
+            self._check_for_ai_turn()
 
     def _check_for_game_end(self) -> bool:
         """
@@ -257,27 +330,28 @@ class TicTacToeGUI:
         Returns:
             True if the game ended, False otherwise.
         """
-        winner = self.game_engine.get_winner()
-        is_tie = self.game_engine.is_tie()
-        
-        if winner:
-            self.scores[winner] += 1
-            self._disable_all_buttons()
-        elif is_tie:
-            self.scores["Ties"] += 1
-            self._disable_all_buttons()
+        result = self.game_engine.get_result()
+        if result is None:
+            return False
             
-        if winner or is_tie:
+        with self._batch():
+            if result == TIE:
+                self.scores["Ties"] += 1
+            else:
+                self.scores[result] += 1
+            self._disable_all_buttons()
             self._update_scoreboard()
             self._update_status_bar()
-            return True
-            
-        return False
+        return True
 
     # --- Event Handlers (Menu) ---
 
     def _on_mode_change(self):
         """Called when a Mode menu radio button is clicked."""
+        mode = self.mode_var.get()
+        if mode == self._mode:
+            return # Same mode picked again, keep the current game
+        self._mode = mode
         self.new_game() # Start a new game whenever mode changes
 
     def _on_player_change(self, *args):
@@ -285,59 +359,150 @@ class TicTacToeGUI:
         Called when the Player menu (X/O) is changed.
         The *args is required by the trace_add callback.
         """
+        player = self.human_player_var.get()
+        if player == self._human_player:
+            return # Same side picked again, keep the current game
+        self._human_player = player
         # Only start a new game if the mode is relevant
-        if self.mode_var.get() == "Human vs AI":
+        if self._mode != "Human vs AI":
+            return
+        if not (self.game_engine.x_mask | self.game_engine.o_mask):
+            # Nothing to clear, only who moves first has changed
+            self._restart_turns()
+        else:
             self.new_game()
 
     # --- UI Update (Helper) Methods ---
 
+    @contextmanager
+    def _batch(self):
+        """
+        Groups UI updates so the window is redrawn once, when the
+        outermost block ends. The _update_* methods only mark their
+        part of the window as pending while a block is open; called
+        outside one, they redraw straight away.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                self._flush_pending()
+
+    def _flush_pending(self):
+        """
+        Redraws every pending part of the window, then the window once,
+        then queues the AI's move if one is pending.
+        """
+        pending, self._pending = self._pending, set()
+        changed = False
+        if "board" in pending:
+            changed |= self._draw_board_buttons()
+        if "buttons" in pending:
+            changed |= self._draw_button_states()
+        if "score" in pending:
+            changed |= self._draw_scoreboard()
+        if "status" in pending:
+            self._draw_status_bar()
+            changed = True
+        if changed:
+            self.root.update_idletasks()
+        if "ai" in pending:
+            # Queued only now: update_idletasks above runs idle callbacks
+            # too, and would otherwise play the move inside this call
+            self._ai_job = self.root.after_idle(self._make_ai_move)
+
     def _update_board_buttons(self):
         """Syncs the text of the 3x3 buttons with the engine's board."""
-        for r in range(3):
-            for c in range(3):
-                text = self.game_engine.board[r][c]
-                self.board_buttons[r][c].config(text=text)
+        with self._batch():
+            self._pending.add("board")
 
     def _update_scoreboard(self):
         """Updates the X Wins, O Wins, and Ties labels."""
-        self.score_label_x.config(text=f"X Wins: {self.scores['X']}")
-        self.score_label_o.config(text=f"O Wins: {self.scores['O']}")
-        self.score_label_ties.config(text=f"Ties: {self.scores['Ties']}")
+        with self._batch():
+            self._pending.add("score")
 
     def _update_status_bar(self):
         """Updates the text in the bottom status label."""
-        winner = self.game_engine.get_winner()
-        is_tie = self.game_engine.is_tie()
-        
-        if winner:
-            message = f"Game Over: Player {winner} wins!"
-        elif is_tie:
-            message = "Game Over: It's a tie!"
-        else:
-            mode = self.mode_var.get()
-            player = self.game_engine.current_player
-            message = f"Mode: {mode}  |  Current Player: {player}"
-        
-        self.status_label.config(text=message)
+        with self._batch():
+            self._pending.add("status")
 
     def _disable_all_buttons(self):
         """Disables all 9 board buttons."""
-        for r in range(3):
-            for c in range(3):
-                self.board_buttons[r][c].config(state=DISABLED)
+        self._set_all_buttons_state(DISABLED)
 
     def _enable_all_buttons(self):
         """Enables all 9 board buttons."""
         # Note: We could be smarter and only enable *empty* ones,
         # but clicking an occupied one does nothing anyway.
         # This is simpler.
-        for r in range(3):
-            for c in range(3):
-                self.board_buttons[r][c].config(state=NORMAL)
+        self._set_all_buttons_state(NORMAL)
+
+    def _set_all_buttons_state(self, state: str):
+        """Sets every board button to state (the last one set in a batch wins)."""
+        with self._batch():
+            self._buttons_state = state
+            self._pending.add("buttons")
+
+    def _draw_board_buttons(self) -> bool:
+        """Configures the buttons whose text differs from the board."""
+        game = self.game_engine
+        last_text = self._last_text
+        changed = False
+        tk_call = self._tk_call
+        paths = self._button_paths
+        for i, text in enumerate(engine.board_chars(game.x_mask, game.o_mask)):
+            if text != last_text[i]:
+                tk_call(paths[i], "configure", "-text", text)
+                last_text[i] = text
+                changed = True
+        return changed
+
+    def _draw_button_states(self) -> bool:
+        """Configures the buttons not yet in _buttons_state."""
+        state = self._buttons_state
+        last_state = self._last_state
+        changed = False
+        tk_call = self._tk_call
+        for i, path in enumerate(self._button_paths):
+            if last_state[i] != state:
+                tk_call(path, "configure", "-state", state)
+                last_state[i] = state
+                changed = True
+        return changed
+
+    def _draw_scoreboard(self) -> bool:
+        """Sets the X Wins, O Wins, and Ties labels whose text changed."""
+        texts = {"X": f"X Wins: {self.scores['X']}",
+                 "O": f"O Wins: {self.scores['O']}",
+                 "Ties": f"Ties: {self.scores['Ties']}"}
+        changed = False
+        for key, text in texts.items():
+            if text != self._last_score_text[key]:
+                self._score_labels[key].config(text=text)
+                self._last_score_text[key] = text
+                changed = True
+        return changed
+
+    def _draw_status_bar(self):
+        """Sets the status label text from the engine's state."""
+        result = self.game_engine.get_result()
+        
+        if result == TIE:
+            message = "Game Over: It's a tie!"
+        elif result:
+            message = f"Game Over: Player {result} wins!"
+        else:
+            mode = self._mode
+            player = self.game_engine.current_player
+            message = f"Mode: {mode}  |  Current Player: {player}"
+        
+        self.status_label.config(text=message)
                 
     def _update_player_menu_state(self):
         """Enables/Disables the 'Player' menu based on game mode."""
-        if self.mode_var.get() == "Human vs AI":
+        if self._mode == "Human vs AI":
             self.player_menu.entryconfig("Play as X", state=NORMAL)
             self.player_menu.entryconfig("Play as O", state=NORMAL)
         else:
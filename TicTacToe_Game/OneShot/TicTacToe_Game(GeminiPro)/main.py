@@ -43,6 +43,18 @@ Alpha-Beta Pruning.
     * Tie:      0
 * **Pruning:** Alpha-beta pruning is used to significantly cut down
     the search space, allowing for an instantaneous response.
+* **Precomputation:** On the first AI move, `engine.py` solves every
+    reachable position once into `BEST_MOVE` (keyed on the board packed
+    into two 9-bit masks), so `find_best_move` is normally a single
+    dictionary lookup.
+* **Numba (optional):** If numba is installed, searches outside
+    `BEST_MOVE` run a compiled copy of the search (`minimax_kernel`).
+    It is compiled on the first such search, not at import; normal
+    play never needs it.
+* **Cython (optional):** `engine_core.pyx` is a C build of the same
+    search. Build it with `cythonize -i engine_core.pyx` (needs Cython
+    and a C compiler) and `engine.py` uses it in preference to numba
+    and the pure Python search.
 * **Determinism:** The AI is fully deterministic. When faced with
     multiple moves of equal (and optimal) value, it *always*
     chooses the first one it finds. The search order is
@@ -63,6 +75,8 @@ File Structure
     application window, menu bar, game board, scoreboard, and
     status bar. It handles all user events and drives the
     game by calling the `engine`.
+* **engine_core.pyx:** Optional Cython build of the search
+    (see above). The game runs without it.
 
 -------------------------------------------------
 Known Limitations